@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: course bonus scoring over a synthetic course catalog
+
+Usage (from the backend folder):
+    python benchmarks/bench_bonus_calculator.py [--courses 100000] [--rows 300000] [--seed 42] [--processes 4]
+"""
+import argparse
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from bonus_calculatorF import bonus_calculator
+from bonus_calculatorF.columnar import score_columns
+from bonus_calculatorF.bonus_calculator import (FIELD_MATCHER, FIELD_SCORES, INSTITUTION_NORMALIZER, INSTITUTION_SCORES,
+                                                 SKILL_NORMALIZER, SKILL_SCORES)
+
+TITLE_WORDS = ("introduction to", "advanced", "applied", "practical", "foundations of", "for everyone",
+               "with python", "and", "the complete", "using", "for beginners", "professional certificate",
+               "specialization", "capstone project", "fundamentals", "in practice")
+DURATIONS = ("Approx. 4 weeks at 5 hours a week", "3 months at 10 hours a week", "Approx. 20 hours to complete",
+             "6 weeks", "1 month", "12 hours", "2 months at 8 hours a week", "Approx. 45 hours to complete",
+             "10 weeks of study, 3-4 hours/week", "Self-paced", "", "1 week at 6 hours")
+
+
+def synthetic_catalog(n_courses, seed=42):
+    """Course dicts shaped like the Coursera scraper output"""
+    rng = random.Random(seed)
+    fields = [f for f in FIELD_SCORES if f != "default"]
+    institutions = [i for i in INSTITUTION_SCORES if i != "default"] + ["Unlisted College", "Acme Academy"]
+    skills = [s for s in SKILL_SCORES if s != "default"] + ["Underwater Basket Weaving", "Juggling"]
+    catalog = []
+    for _ in range(n_courses):
+        parts = rng.sample(TITLE_WORDS, 2) + rng.sample(fields, rng.choice((0, 1, 1, 2)))
+        rng.shuffle(parts)
+        catalog.append({
+            "title": " ".join(parts).title(),
+            "institution": rng.choice(institutions),
+            "duration": rng.choice(DURATIONS),
+            "skills": [s.title() for s in rng.sample(skills, rng.randint(0, 8))],
+        })
+    return catalog
+
+
+def substring_field_score(title):
+    """The original per-key substring scan, kept as the reference result"""
+    field_points = 0
+    for field, score in FIELD_SCORES.items():
+        if field in title:
+            field_points = max(field_points, score)
+    return field_points or FIELD_SCORES["default"]
+
+
+def bench_field_matcher(catalog):
+    titles = [course["title"].lower() for course in catalog]
+
+    start = time.perf_counter()
+    expected = [substring_field_score(title) for title in titles]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = [FIELD_MATCHER.best_score(title) or FIELD_SCORES["default"] for title in titles]
+    matcher_time = time.perf_counter() - start
+
+    assert got == expected, "field matcher diverged from substring scan"
+    print(f"field match    {len(titles):>9} titles  scan {scan_time:7.3f}s  matcher {matcher_time:7.3f}s  "
+          f"{scan_time / matcher_time:5.1f}x")
+
+
+def bench_name_lookup(catalog):
+    """Raw dict lookups vs the normalizers, on names with scraper-style variations"""
+    rng = random.Random(7)
+    variants = (str.upper, lambda s: s.replace(" ", "-"), lambda s: s.replace(" University", ""),
+                lambda s: "The " + s, lambda s: s)
+    institutions = [rng.choice(variants)(course["institution"]) for course in catalog]
+    skills = [rng.choice(variants)(skill) for course in catalog for skill in course["skills"]]
+
+    for label, names, raw, normalizer in (("institution", institutions, lambda n: INSTITUTION_SCORES.get(n.strip()),
+                                           INSTITUTION_NORMALIZER),
+                                          ("skill", skills, lambda n: SKILL_SCORES.get(n.lower()), SKILL_NORMALIZER)):
+        start = time.perf_counter()
+        raw_hits = sum(raw(name) is not None for name in names)
+        raw_time = time.perf_counter() - start
+        start = time.perf_counter()
+        hits = sum(normalizer.canonical(name) is not None for name in names)
+        normalized_time = time.perf_counter() - start
+        print(f"{label + ' names':<14} {len(names):>9} names   raw {raw_time:7.3f}s ({raw_hits / len(names):4.0%} hits)  "
+              f"normalized {normalized_time:7.3f}s ({hits / len(names):4.0%} hits)")
+
+
+def bench_course_bonus(catalog):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for course in catalog:
+            bonus_calculator.calculate_course_bonus(course)
+    elapsed = time.perf_counter() - start
+    print(f"course bonus   {len(catalog):>9} courses {elapsed:7.3f}s  ({len(catalog) / elapsed:,.0f} courses/s)")
+
+
+def bench_batch(catalog, processes):
+    start = time.perf_counter()
+    bonus_calculator.score_courses(catalog)
+    elapsed = time.perf_counter() - start
+    print(f"score_courses  {len(catalog):>9} courses {elapsed:7.3f}s  ({len(catalog) / elapsed:,.0f} courses/s)")
+    if processes and processes > 1:
+        start = time.perf_counter()
+        bonus_calculator.score_courses(catalog, processes=processes)
+        elapsed = time.perf_counter() - start
+        print(f"  x{processes} procs   {len(catalog):>9} courses {elapsed:7.3f}s  "
+              f"({len(catalog) / elapsed:,.0f} courses/s)")
+
+
+def stored_rows(catalog, n_rows, seed=42):
+    """user_courses_new-like rows: many users per course, popularity heavy-tailed"""
+    rng = random.Random(seed)
+    return [catalog[min(int(rng.paretovariate(1.1)), len(catalog)) - 1] for _ in range(n_rows)]
+
+
+def bench_columnar(rows, label):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for course in rows:
+            bonus_calculator.calculate_course_bonus(course)
+    per_dict_time = time.perf_counter() - start
+
+    columns = ([c["title"] for c in rows], [c["institution"] for c in rows],
+               [c["duration"] for c in rows], [c["skills"] for c in rows])
+    start = time.perf_counter()
+    scores = score_columns(*columns)
+    columnar_time = time.perf_counter() - start
+
+    assert scores["bonus_points"].tolist() == [s["bonus_points"] for s in bonus_calculator.score_courses(rows)]
+    print(f"{label:<14} {len(rows):>9} rows    per-dict {per_dict_time:7.3f}s  columnar {columnar_time:7.3f}s  "
+          f"{per_dict_time / columnar_time:5.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--courses", type=int, default=100_000)
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--processes", type=int, default=0)
+    args = parser.parse_args()
+    catalog = synthetic_catalog(args.courses, args.seed)
+    bench_field_matcher(catalog)
+    bench_name_lookup(catalog)
+    bench_course_bonus(catalog)
+    bench_batch(catalog, args.processes)
+    bench_columnar(catalog, "columnar/uniq")
+    bench_columnar(stored_rows(catalog[:5000], args.rows, args.seed), "columnar/rows")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming CodeChef profile extraction vs. the BeautifulSoup parse
+
+By default the page is fixtures/codechef_profile.html, a full profile page
+laid out like a saved one: head assets, navigation, the user sidebar,
+contest and problem tables, the heatmap SVG, and the page scripts (with
+activityData) just before </body>, so the streaming extractor has to read
+almost the whole page. --pages benchmarks other saved pages instead.
+--synthetic adds a best-case page of roughly --size-kb kilobytes whose
+fields all come first, letting the extractor stop early.
+
+Usage (from the backend folder):
+    python benchmarks/bench_codechef_parse.py [--pages saved.html ...] [--synthetic] [--size-kb 600] [--repeat 20]
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from rating_scraper_api.CodeChef_api import parse_codechef_profile, parse_codechef_profile_soup
+
+PROFILE_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "codechef_profile.html"
+
+
+def synthetic_page(size_kb=600, days=365):
+    start = date(2024, 1, 1)
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(days)]
+    cells = "".join(
+        f'<rect width="10" height="10" data-date="{d}" data-count="{i % 7}" data-level="{i % 5}"></rect>'
+        for i, d in enumerate(dates))
+    activity = json.dumps({"data": [{"date": d, "value": i % 7} for i, d in enumerate(dates)]})
+    head = (
+        '<html><head><title>chef | CodeChef</title></head><body>'
+        '<header><nav>' + '<a class="menu" href="/x">Item</a>' * 200 + '</nav></header>'
+        '<section class="user-details"><div class="rating-number">1876</div>'
+        '<span class="rating">3&#9733;</span>'
+        '<table class="rating-ranks"><tr><td>Global Rank</td><td>4321</td></tr>'
+        '<tr><td>Country Rank</td><td>1234</td></tr></table></section>'
+        f'<svg class="heatmap">{cells}</svg>'
+        f'<script>var activityData = {activity};</script>'
+        '<h3>Fully Solved (57)</h3>'
+    )
+    row = ('<tr><td class="contest"><a href="/START{0}">Starters {0}</a></td>'
+           '<td>{0}</td><td><span class="problem">PROB{0}</span></td></tr>')
+    tail, i = [], 0
+    while len(head) + sum(map(len, tail)) < size_kb * 1024:
+        tail.append(row.format(i))
+        i += 1
+    return head + '<table class="history">' + "".join(tail) + '</table></body></html>'
+
+
+def measure(func, html, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func("chef", html)
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    func("chef", html)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run(pages, repeat):
+    print(f"{'page':>24} {'KB':>6} {'soup (ms)':>10} {'stream (ms)':>12} {'speedup':>8} "
+          f"{'soup peak MB':>13} {'stream peak MB':>15}")
+    for name, html in pages:
+        soup_result, soup_time, soup_peak = measure(parse_codechef_profile_soup, html, repeat)
+        fast_result, fast_time, fast_peak = measure(parse_codechef_profile, html, repeat)
+        assert fast_result == soup_result, f"{name}: streaming extractor diverged from soup"
+        print(f"{name[-24:]:>24} {len(html) // 1024:>6} {soup_time * 1e3:>10.1f} {fast_time * 1e3:>12.1f} "
+              f"{soup_time / fast_time:>7.1f}x {soup_peak / 2**20:>13.1f} {fast_peak / 2**20:>15.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", nargs="*", default=[str(PROFILE_FIXTURE)])
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--size-kb", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    pages = [(Path(path).name, Path(path).read_text(encoding="utf-8")) for path in args.pages]
+    if args.synthetic:
+        pages.append(("synthetic (best case)", synthetic_page(args.size_kb)))
+    run(pages, args.repeat)
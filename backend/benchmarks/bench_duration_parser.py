@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: course duration parsing throughput
+
+Compares the original digit-joining parse with the compiled, memoized
+duration parser over a catalog-like corpus: a few hundred distinct duration
+strings, repeated with a heavy-tailed popularity.
+
+Usage (from the backend folder):
+    python benchmarks/bench_duration_parser.py [--strings 500000] [--distinct 400] [--seed 42]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from bonus_calculatorF import duration_parser
+
+TEMPLATES = ("Approx. {w} weeks at {h} hours a week", "{m} months at {h} hours a week",
+             "Approx. {t} hours to complete", "{w} weeks", "{m} month", "{t} hours",
+             "{w} weeks of study, {h}-{h2} hours/week", "{h} hours a week for {w} weeks",
+             "Self-paced", "", "1 week at {h} hours", "Flexible schedule")
+
+
+def duration_corpus(n_strings, n_distinct, seed=42):
+    rng = random.Random(seed)
+    distinct = set()
+    while len(distinct) < n_distinct:
+        h = rng.randint(1, 12)
+        distinct.add(rng.choice(TEMPLATES).format(w=rng.randint(1, 16), m=rng.randint(1, 9), t=rng.randint(2, 90),
+                                                  h=h, h2=h + rng.randint(1, 4)))
+    distinct = sorted(distinct)
+    rng.shuffle(distinct)
+    return [distinct[min(int(rng.paretovariate(1.0)), n_distinct) - 1] for _ in range(n_strings)]
+
+
+def digit_join_points(duration):
+    """The original duration branch of calculate_course_bonus"""
+    duration_lower = duration.lower()
+    if "week" in duration_lower:
+        try:
+            weeks = int(''.join(filter(str.isdigit, duration_lower)))
+            return 5 if weeks >= 10 else 4 if weeks >= 6 else 3 if weeks >= 4 else 2 if weeks >= 2 else 1
+        except ValueError:
+            return 2
+    if "month" in duration_lower:
+        try:
+            months = int(''.join(filter(str.isdigit, duration_lower)))
+            return 5 if months >= 6 else 4 if months >= 3 else 3 if months >= 2 else 2
+        except ValueError:
+            return 3
+    if "hour" in duration_lower:
+        try:
+            hours = int(''.join(filter(str.isdigit, duration_lower)))
+            return 3 if hours >= 40 else 2 if hours >= 20 else 1
+        except ValueError:
+            return 1
+    return 2
+
+
+def bench(corpus):
+    start = time.perf_counter()
+    old = [digit_join_points(d) for d in corpus]
+    old_time = time.perf_counter() - start
+
+    duration_parser._parse.cache_clear()
+    start = time.perf_counter()
+    new = [duration_parser.duration_points(d) for d in corpus]
+    new_time = time.perf_counter() - start
+
+    duration_parser._parse.cache_clear()
+    start = time.perf_counter()
+    for d in set(corpus):
+        duration_parser._parse.__wrapped__(d)
+    uncached_time = time.perf_counter() - start
+
+    changed = sum(a != b for a, b in zip(old, new))
+    print(f"{len(corpus):,} strings ({len(set(corpus))} distinct)")
+    print(f"  digit-join       {old_time:7.3f}s  ({len(corpus) / old_time:>12,.0f} strings/s)")
+    print(f"  memoized regex   {new_time:7.3f}s  ({len(corpus) / new_time:>12,.0f} strings/s)  "
+          f"{old_time / new_time:4.1f}x")
+    print(f"  regex, uncached  {uncached_time / len(set(corpus)) * 1e6:7.2f} us per distinct string")
+    print(f"  points changed for {changed / len(corpus):.1%} of strings (multi-quantity durations)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strings", type=int, default=500_000)
+    parser.add_argument("--distinct", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    bench(duration_corpus(args.strings, args.distinct, args.seed))
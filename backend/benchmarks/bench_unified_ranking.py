@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized UnifiedRankingSystem rating update vs. the per-user loop
+
+Usage (from the backend folder):
+    python benchmarks/bench_unified_ranking.py [--sizes 10000 100000 1000000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from logic_formulas.formula_main import UnifiedRankingSystem
+
+PLATFORMS = {"Codeforces": 3000, "Leetcode": 2500, "CodeChef": 1800, "AtCoder": 2800}
+
+
+def legacy_update_all_ratings(system):
+    """The original per-user, per-platform loop, kept as the reference result."""
+    results = {}
+    for user in system.users.values():
+        unified_rating = 0.0
+        total_weight = 0.0
+        for platform_name, weight in system.final_weights.items():
+            rating = user.platform_ratings.get(platform_name)
+            if rating is None:
+                rating = system._impute_missing_rating(user, platform_name)
+            unified_rating += weight * rating
+            total_weight += weight
+        results[user.user_id] = unified_rating / total_weight if total_weight > 0 else 0
+    return results
+
+
+def build_system(n_users, missing=0.3, seed=42):
+    rng = np.random.default_rng(seed)
+    system = UnifiedRankingSystem()
+    for name, max_rating in PLATFORMS.items():
+        system.add_platform(name, max_rating)
+    user_ids = [f"user{i}" for i in range(n_users)]
+    for user_id in user_ids:
+        system.add_user(user_id)
+    for name, max_rating in PLATFORMS.items():
+        present = rng.random(n_users) >= missing
+        ratings = rng.integers(0, max_rating, n_users)
+        current = {u: int(r) for u, r, keep in zip(user_ids, ratings, present) if keep}
+        system.update_platform_stats(name, difficulty=2100, participation=0.8, current_ratings=current)
+    return system
+
+
+def run(sizes):
+    print(f"{'users':>10} {'loop (s)':>10} {'matrix (s)':>11} {'speedup':>9} {'max |diff|':>11}")
+    for n_users in sizes:
+        system = build_system(n_users)
+
+        start = time.perf_counter()
+        expected = legacy_update_all_ratings(system)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        system._update_all_ratings()
+        matrix_time = time.perf_counter() - start
+
+        got = system.matrix.unified[:system.matrix.size]
+        want = np.array([expected[u] for u in system.matrix.user_ids])
+        max_diff = float(np.abs(got - want).max())
+        assert np.allclose(got, want, rtol=1e-12, atol=1e-9), "matrix engine diverged from loop"
+        print(f"{n_users:>10} {loop_time:>10.3f} {matrix_time:>11.4f} "
+              f"{loop_time / matrix_time:>8.0f}x {max_diff:>11.2e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    run(parser.parse_args().sizes)
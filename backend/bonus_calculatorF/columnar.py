@@ -0,0 +1,126 @@
+"""
+Columnar bulk scoring for course catalogs
+
+score_columns() scores parallel sequences of titles, institutions,
+durations and skill lists and returns numpy arrays instead of per-course
+dicts. Every column is factorized into integer codes first, so each
+distinct institution, duration, title and skill is scored once and the
+per-row values are gathered with array indexing; the top-3 skill average
+is computed over the flattened skill column with a grouped sort. Results
+match score_course() row for row.
+"""
+from itertools import chain
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bonus_calculatorF import bonus_calculator
+from bonus_calculatorF.score_tables import ScoreTables
+
+MAX_POSSIBLE_POINTS = 45
+TOP_SKILLS = 3
+
+
+def factorize(values: Sequence[Hashable]) -> Tuple[np.ndarray, List[Hashable]]:
+    """(codes, uniques) with ``uniques[codes[i]] == values[i]``, uniques in first-seen order"""
+    uniques = list(dict.fromkeys(values))
+    index: Dict[Hashable, int] = {value: code for code, value in enumerate(uniques)}
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.int64, count=len(values))
+    return codes, uniques
+
+
+def _lookup(values: Sequence[Hashable], score) -> np.ndarray:
+    """score(value) for every value, computed once per distinct value"""
+    codes, uniques = factorize(values)
+    table = np.fromiter((score(value) for value in uniques), dtype=np.float64, count=len(uniques))
+    return table[codes]
+
+
+def _duration_score(duration: Any) -> float:
+    # Lists and other unhashable values are not strings, so they score 0 either way
+    return bonus_calculator.score_duration(duration)
+
+
+def _round1(values: np.ndarray) -> np.ndarray:
+    """Python's round(value, 1) elementwise, evaluated once per distinct value"""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    return np.array([round(value, 1) for value in uniques.tolist()])[inverse.reshape(-1)]
+
+
+def skill_points(skill_lists: Sequence[Sequence[str]], tables: Optional[ScoreTables] = None) -> np.ndarray:
+    """Twice the average of each row's top-3 skill scores (0 for rows without skills)"""
+    tables = tables or bonus_calculator.SCORE_TABLES
+    # Rows of the same course share a skill list; score each distinct list once
+    codes, unique_lists = factorize([tuple(skills) if skills else () for skills in skill_lists])
+    return _skill_points(unique_lists, tables)[codes]
+
+
+def _skill_points(skill_lists: Sequence[Sequence[str]], tables: ScoreTables) -> np.ndarray:
+    n = len(skill_lists)
+    lengths = np.fromiter((len(skills) if skills else 0 for skills in skill_lists), dtype=np.int64, count=n)
+    flat = list(chain.from_iterable(skills for skills in skill_lists if skills))
+    scores = _lookup(flat, tables.skill_normalizer.score)
+    rows = np.repeat(np.arange(n), lengths)
+
+    # Within each row, highest scores first; keep the first TOP_SKILLS of every row
+    order = np.lexsort((-scores, rows))
+    starts = np.cumsum(lengths) - lengths
+    rank = np.arange(len(flat)) - starts[rows[order]]
+    keep = order[rank < TOP_SKILLS]
+    totals = np.bincount(rows[keep], weights=scores[keep], minlength=n)
+
+    counts = np.minimum(lengths, TOP_SKILLS)
+    points = np.zeros(n)
+    np.divide(totals, counts, out=points, where=counts > 0)
+    return points * 2
+
+
+def score_columns(titles: Sequence[str], institutions: Sequence[str], durations: Sequence[Any],
+                  skills: Sequence[Sequence[str]]) -> Dict[str, Any]:
+    """
+    Score courses given as parallel columns.
+
+    Args:
+        titles: Course titles.
+        institutions: Institution names (None for unknown).
+        durations: Duration strings as scraped ("6 weeks", "Approx. 20 hours to complete").
+        skills: One list of skill names per course (None or [] for none).
+
+    Returns:
+        Dict[str, Any]: float arrays "bonus_points" and "bonus_percentage" (rounded to
+        one decimal) and "bonus_breakdown" with arrays "institution", "duration",
+        "field" and "skills", all aligned with the input rows, plus the
+        score_table_version they were computed with.
+    """
+    tables = bonus_calculator.SCORE_TABLES
+    n = len(titles)
+    if not (len(institutions) == len(durations) == len(skills) == n):
+        raise ValueError("titles, institutions, durations and skills must have the same length")
+
+    default_field = tables.field_scores["default"]
+    institution = _lookup(institutions, lambda name: tables.institution_normalizer.score((name or "").strip()))
+    duration = _lookup([d if isinstance(d, str) else None for d in durations], _duration_score)
+    field = _lookup(titles, lambda title: tables.field_matcher.best_score((title or "").lower()) or default_field)
+    skill = skill_points(skills, tables)
+
+    # Same summation order as score_course, so the totals round identically
+    total = institution + duration + field + skill
+    return {
+        "bonus_points": _round1(total),
+        "bonus_percentage": _round1(total / MAX_POSSIBLE_POINTS * 100),
+        "bonus_breakdown": {
+            "institution": institution,
+            "duration": duration,
+            "field": field,
+            "skills": skill
+        },
+        "score_table_version": tables.version
+    }
+
+
+def score_course_columns(courses: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """score_columns() over course dicts shaped like calculate_course_bonus input"""
+    return score_columns([course.get("title", "") for course in courses],
+                         [course.get("institution") for course in courses],
+                         [course.get("duration", "") for course in courses],
+                         [course.get("skills", []) for course in courses])
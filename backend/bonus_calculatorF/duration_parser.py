@@ -0,0 +1,118 @@
+"""
+Course duration parsing
+
+Scraped durations come as free text ("Approx. 4 weeks at 5 hours a week",
+"3 months at 10 hours a week", "Approx. 20 hours to complete"). A single
+compiled pattern pulls out every quantity with its unit; rates ("5 hours a
+week") set the study intensity and the first other quantity is the course
+length. Results are memoized per string, since the same few hundred
+duration strings repeat across the whole catalog.
+
+Points keep the original tiers (weeks, months or hours, by the unit of the
+course length) but use that quantity alone: the old digit-joining parse
+read "3 months at 10 hours a week" as 310 months.
+"""
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# Typical Coursera pacing when a duration gives no weekly hours
+DEFAULT_HOURS_PER_WEEK = 5
+WEEKS_PER_MONTH = 52 / 12
+
+_UNITS = {"h": "hour", "hr": "hour", "hrs": "hour", "hour": "hour", "hours": "hour",
+          "wk": "week", "wks": "week", "week": "week", "weeks": "week",
+          "mo": "month", "mos": "month", "month": "month", "months": "month"}
+
+# "<number>[-<number>][-]<unit>[ per|a|/ <unit>]" ("12-week", "3-4 hours/week");
+# a trailing "per <unit>" marks a rate
+_QUANTITY = re.compile(
+    r"(\d+(?:\.\d+)?)(?:\s*(?:-|–|to)\s*\d+(?:\.\d+)?)?\s*-?\s*"
+    r"(hours?|hrs?|h|weeks?|wks?|months?|mos?)\b"
+    r"(?:\s*(?:/|per|a|an|each)\s*(week|wk|month|mo|day)\b)?",
+    re.IGNORECASE)
+
+# Points when the unit is known but no number can be read ("a few weeks"),
+# checked in this order
+_UNPARSED_POINTS = (("week", 2), ("month", 3), ("hour", 1))
+UNKNOWN_FORMAT_POINTS = 2
+
+
+def _tier(unit: str, value: float) -> int:
+    if unit == "week":
+        if value >= 10:
+            return 5  # Long courses (10+ weeks)
+        if value >= 6:
+            return 4  # Medium-long courses (6-9 weeks)
+        if value >= 4:
+            return 3  # Medium courses (4-5 weeks)
+        if value >= 2:
+            return 2  # Short-medium courses (2-3 weeks)
+        return 1  # Very short courses (1 week)
+    if unit == "month":
+        if value >= 6:
+            return 5  # Very long courses (6+ months)
+        if value >= 3:
+            return 4  # Long courses (3-5 months)
+        if value >= 2:
+            return 3  # Medium courses (2 months)
+        return 2  # Shorter courses (1 month)
+    if value >= 40:
+        return 3  # Medium courses (40+ hours)
+    if value >= 20:
+        return 2  # Short-medium courses (20-39 hours)
+    return 1  # Very short courses (<20 hours)
+
+
+def _quantities(text: str) -> List[Tuple[float, str, Optional[str]]]:
+    """(value, unit, per-unit or None) for every quantity in ``text``"""
+    quantities = []
+    for value, unit, per in _QUANTITY.findall(text):
+        unit = _UNITS[unit.lower()]
+        per = _UNITS.get(per.lower(), per.lower()) if per else None
+        quantities.append((float(value), unit, per))
+    return quantities
+
+
+@lru_cache(maxsize=4096)
+def _parse(text: str) -> Tuple[Optional[float], int]:
+    quantities = _quantities(text)
+    rates = [(value, per) for value, unit, per in quantities if per and unit == "hour"]
+    lengths = [(value, unit) for value, unit, per in quantities if not per]
+
+    if not quantities:
+        text = text.lower()
+        return None, next((points for unit, points in _UNPARSED_POINTS if unit in text),
+                          UNKNOWN_FORMAT_POINTS)
+    if not lengths:
+        # Only a pace ("3-4 hours/week"): tier by it, total hours unknown
+        value, unit = quantities[0][:2]
+        return None, _tier(unit, value)
+
+    value, unit = lengths[0]
+    hours_per_week = DEFAULT_HOURS_PER_WEEK
+    if rates:
+        rate, per = rates[0]
+        hours_per_week = {"day": rate * 7, "month": rate / WEEKS_PER_MONTH}.get(per, rate)
+
+    if unit == "hour":
+        hours = value
+    elif unit == "week":
+        hours = value * hours_per_week
+    else:
+        hours = value * WEEKS_PER_MONTH * hours_per_week
+    return hours, _tier(unit, value)
+
+
+def duration_hours(duration) -> Optional[float]:
+    """Total study hours of a duration string, or None when it gives no course length"""
+    return _parse(duration)[0] if isinstance(duration, str) else None
+
+
+def duration_points(duration) -> int:
+    """Duration points (0-5): 0 for non-strings, 2 for unrecognised formats"""
+    return _parse(duration)[1] if isinstance(duration, str) else 0
+
+
+def cache_info():
+    return _parse.cache_info()
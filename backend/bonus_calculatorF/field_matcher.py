@@ -0,0 +1,67 @@
+"""
+Multi-pattern field matcher for course titles
+
+Finds the highest-scoring FIELD_SCORES key that occurs anywhere in a title
+(plain substring semantics, overlaps included) in a single pass over the
+title. The keys are compiled once into an Aho-Corasick automaton whose
+failure links are resolved ahead of time, so matching is one dict lookup
+per character instead of one substring scan per key.
+"""
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+
+class FieldMatcher:
+    """Aho-Corasick automaton over score-table keys"""
+
+    def __init__(self, scores: Dict[str, float]):
+        self.scores = dict(scores)
+        goto: List[Dict[str, int]] = [{}]
+        best: List[Tuple[float, Optional[str]]] = [(0, None)]
+
+        for key, score in self.scores.items():
+            state = 0
+            for ch in key:
+                if ch not in goto[state]:
+                    goto.append({})
+                    best.append((0, None))
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            if score > best[state][0]:
+                best[state] = (score, key)
+
+        # Breadth-first: a state's failure target is always shallower, so its
+        # resolved transitions exist by the time they are needed.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [{}] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0)
+                if best[fail[child]][0] > best[child][0]:
+                    best[child] = best[fail[child]]
+                queue.append(child)
+            delta[state] = {**delta[fail[state]], **goto[state]}
+
+        self._delta = delta
+        self._best_score = [score for score, _ in best]
+        self._best_key = [key for _, key in best]
+        self.max_score = max(self.scores.values(), default=0)
+
+    def best_match(self, text: str) -> Tuple[Optional[str], float]:
+        """(key, score) of the highest-scoring key contained in ``text``, or (None, 0)"""
+        delta, scores = self._delta, self._best_score
+        state = best_state = 0
+        best_score = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if scores[state] > best_score:
+                best_score, best_state = scores[state], state
+                if best_score >= self.max_score:
+                    break
+        return self._best_key[best_state], best_score
+
+    def best_score(self, text: str) -> float:
+        return self.best_match(text)[1]
@@ -0,0 +1,80 @@
+"""
+Name normalization for score-table lookups
+
+Scrapers report institutions and skills with inconsistent casing,
+punctuation and naming ("Machine-Learning", "Stanford" for "Stanford
+University"). NameNormalizer maps such variants onto the keys of a score
+table: the table is indexed once by a canonical form of each key (plus
+aliases), and each distinct input name is resolved once and kept in a
+bounded LRU cache, since the same names recur across thousands of profiles.
+Short names only resolve through the alias table; dropping words such as
+"University of" would turn "California" into "University of California".
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+# Anything but letters, digits, '+' and '#' separates words ("c++", "c#" stay intact)
+_SEPARATORS = re.compile(r"[^\w+#]+|_")
+
+# Leading words ignored when matching institution names
+# ("The University of Oxford" -> "university of oxford")
+INSTITUTION_LEADING_WORDS = ("the",)
+
+
+def canonical_form(name: str) -> str:
+    """Case- and punctuation-insensitive form of ``name`` ("Machine-Learning" -> "machine learning")"""
+    name = unicodedata.normalize("NFKC", name).casefold().replace("&", " and ")
+    return " ".join(_SEPARATORS.sub(" ", name).split())
+
+
+def strip_leading_words(form: str, leading_words: Iterable[str]) -> str:
+    """Canonical ``form`` without the ``leading_words`` it starts with"""
+    words = form.split()
+    leading = set(leading_words)
+    while len(words) > 1 and words[0] in leading:
+        words.pop(0)
+    return " ".join(words)
+
+
+class NameNormalizer:
+    """Resolves free-form names to the keys of a score table"""
+
+    def __init__(self, scores: Dict[str, float], aliases: Optional[Dict[str, str]] = None,
+                 leading_words: Iterable[str] = (), cache_size: int = 4096):
+        self.scores = scores
+        self.default = scores.get("default", 0)
+        self._leading_words = tuple(leading_words)
+        index: Dict[str, str] = {}
+        for key, score in scores.items():
+            if key == "default":
+                continue
+            form = self._form(key)
+            # Keys that only differ in punctuation keep the higher score
+            if form not in index or score > scores[index[form]]:
+                index[form] = key
+
+        for alias, key in (aliases or {}).items():
+            if key in scores:
+                index[self._form(alias)] = key
+        self._index = index
+        self.canonical = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _form(self, name: str) -> str:
+        return strip_leading_words(canonical_form(name), self._leading_words)
+
+    def _resolve(self, name: str) -> Optional[str]:
+        if not isinstance(name, str):
+            return None
+        if name in self.scores and name != "default":
+            return name
+        return self._index.get(self._form(name))
+
+    def score(self, name: str) -> float:
+        """Score of the table key ``name`` resolves to, or the table default"""
+        key = self.canonical(name)
+        return self.scores[key] if key is not None else self.default
+
+    def cache_info(self):
+        return self.canonical.cache_info()
@@ -0,0 +1,92 @@
+"""
+Single-pass profile metrics for scored courses
+
+ProfileAggregator folds each scored course (a course dict carrying
+bonus_points) into running totals and Counters as it is added, so all
+profile metrics come from one walk over the courses. Adding a newly
+completed course later is one more add() instead of a rescore of the
+whole profile; top-N lists are taken with heapq when metrics are read.
+"""
+import heapq
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class ProfileAggregator:
+    """Running profile metrics over scored courses"""
+
+    def __init__(self, skill_score: Callable[[str], float], field_scores: Dict[str, float],
+                 field_to_career: Dict[str, str], top_skills: int = 10, top_fields: int = 5,
+                 top_careers: int = 3):
+        self.skill_score = skill_score
+        self.field_scores = field_scores
+        self.field_to_career = field_to_career
+        self.n_top_skills = top_skills
+        self.n_top_fields = top_fields
+        self.n_top_careers = top_careers
+
+        self.course_count = 0
+        self.total_bonus_points = 0.0
+        self.max_bonus_points: Optional[float] = None
+        self.skill_counts: Counter = Counter()
+        self.skill_values: Dict[str, float] = {}
+        self.field_counts: Counter = Counter()
+        self.career_counts: Counter = Counter()
+
+    def add(self, course: Dict[str, Any]) -> None:
+        """Fold one scored course into the metrics"""
+        points = course.get("bonus_points", 0)
+        self.course_count += 1
+        self.total_bonus_points += points
+        if self.max_bonus_points is None or points > self.max_bonus_points:
+            self.max_bonus_points = points
+
+        for skill in course.get("skills", []):
+            if isinstance(skill, str):
+                if skill not in self.skill_values:
+                    self.skill_values[skill] = self.skill_score(skill)
+                self.skill_counts[skill] += 1
+
+        field = course.get("matched_field", "general")
+        if field != "general":
+            self.field_counts[field] += 1
+        if field in self.field_to_career:
+            self.career_counts[self.field_to_career[field]] += 1
+
+    def add_all(self, courses: Iterable[Dict[str, Any]]) -> "ProfileAggregator":
+        for course in courses:
+            self.add(course)
+        return self
+
+    def top_skills(self) -> List[Dict[str, Any]]:
+        top = heapq.nlargest(self.n_top_skills, self.skill_counts.items(),
+                             key=lambda item: self.skill_values[item[0]] * item[1])
+        return [{"name": skill, "count": count, "value": self.skill_values[skill],
+                 "total_value": self.skill_values[skill] * count}
+                for skill, count in top]
+
+    def top_fields(self) -> List[Dict[str, Any]]:
+        default = self.field_scores["default"]
+        top = heapq.nlargest(self.n_top_fields, self.field_counts.items(),
+                             key=lambda item: self.field_scores.get(item[0], default) * item[1])
+        return [{"name": field, "count": count, "value": self.field_scores.get(field, default),
+                 "total_value": self.field_scores.get(field, default) * count}
+                for field, count in top]
+
+    def career_focus(self) -> List[Dict[str, Any]]:
+        top = heapq.nlargest(self.n_top_careers, self.career_counts.items(), key=lambda item: item[1])
+        return [{"area": area, "strength": count} for area, count in top]
+
+    def metrics(self) -> Dict[str, Any]:
+        """The profile_metrics dict of calculate_profile_bonus (empty for no courses)"""
+        if not self.course_count:
+            return {}
+        return {
+            "total_bonus_points": round(self.total_bonus_points, 1),
+            "average_bonus_points": round(self.total_bonus_points / self.course_count, 1),
+            "max_bonus_points": round(self.max_bonus_points, 1),
+            "course_count": self.course_count,
+            "top_skills": self.top_skills(),
+            "top_fields": self.top_fields(),
+            "career_focus": self.career_focus()
+        }
@@ -0,0 +1,150 @@
+"""
+Score tables: loading, compilation and hot reload
+
+The institution, field and skill score tables (and their alias tables) live
+in score_tables.json, or in the file named by the BONUS_SCORE_TABLES
+environment variable, so they can change without a code deploy. Loading a
+file compiles it once into a ScoreTables artifact: interned keys, the field
+matcher, the name normalizers and a version hash of the table contents.
+Artifacts of the active and the previously active version are kept, so
+reloading an unchanged file (or rolling back one edit) does not recompile;
+older versions are dropped. Long-running workers call reload_score_tables() (or
+reload_if_changed() on a timer) to pick up edits without a restart.
+"""
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from bonus_calculatorF.field_matcher import FieldMatcher
+from bonus_calculatorF.normalization import INSTITUTION_LEADING_WORDS, NameNormalizer
+
+DEFAULT_TABLES_PATH = Path(__file__).with_name("score_tables.json")
+TABLES_PATH_ENV = "BONUS_SCORE_TABLES"
+
+SCORE_TABLE_NAMES = ("institution_scores", "field_scores", "skill_scores")
+ALIAS_TABLE_NAMES = ("institution_aliases", "skill_aliases")
+
+
+class ScoreTables:
+    """A compiled, read-only set of score tables"""
+
+    def __init__(self, data: Dict[str, Any], version: str, source: Optional[str] = None):
+        tables = _validate(data)
+        self.version = version
+        self.source = source
+        self.institution_scores: Dict[str, float] = tables["institution_scores"]
+        self.field_scores: Dict[str, float] = tables["field_scores"]
+        self.skill_scores: Dict[str, float] = tables["skill_scores"]
+        self.institution_aliases: Dict[str, str] = tables["institution_aliases"]
+        self.skill_aliases: Dict[str, str] = tables["skill_aliases"]
+
+        self.field_matcher = FieldMatcher(self.field_scores)
+        self.institution_normalizer = NameNormalizer(self.institution_scores, self.institution_aliases,
+                                                     leading_words=INSTITUTION_LEADING_WORDS)
+        self.skill_normalizer = NameNormalizer(self.skill_scores, self.skill_aliases)
+
+    def __repr__(self):
+        return f"ScoreTables(version={self.version!r}, source={self.source!r})"
+
+
+def _validate(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Interned copies of the tables; raises ValueError on a malformed file"""
+    if not isinstance(data, dict):
+        raise ValueError("score tables must be a JSON object")
+    tables = {}
+    for name in SCORE_TABLE_NAMES:
+        table = data.get(name)
+        if not isinstance(table, dict) or "default" not in table:
+            raise ValueError(f"score table '{name}' is missing or has no 'default' entry")
+        for key, score in table.items():
+            if isinstance(score, bool) or not isinstance(score, (int, float)):
+                raise ValueError(f"score table '{name}': score for '{key}' is not a number")
+        tables[name] = {sys.intern(key): score for key, score in table.items()}
+    for name in ALIAS_TABLE_NAMES:
+        aliases = data.get(name, {})
+        if not isinstance(aliases, dict):
+            raise ValueError(f"alias table '{name}' must be an object")
+        tables[name] = {sys.intern(alias): sys.intern(key) for alias, key in aliases.items()}
+    return tables
+
+
+def table_version(data: Dict[str, Any]) -> str:
+    """Content hash of the tables (independent of key order and formatting)"""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+_lock = threading.Lock()
+_compiled: Dict[str, ScoreTables] = {}
+_current: Optional[ScoreTables] = None
+_previous: Optional[ScoreTables] = None
+_current_stat = None
+_listeners: List[Callable[[ScoreTables], None]] = []
+
+
+def tables_path(path: Optional[str] = None) -> Path:
+    return Path(path or os.environ.get(TABLES_PATH_ENV) or DEFAULT_TABLES_PATH)
+
+
+def load_score_tables(path: Optional[str] = None) -> ScoreTables:
+    """Compile the tables in ``path`` (reusing the artifact of an identical earlier load)"""
+    path = tables_path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    version = table_version(data)
+    with _lock:
+        tables = _compiled.get(version)
+        if tables is None:
+            tables = ScoreTables(data, version, str(path))
+            _retain(tables, _current, _previous)
+        return tables
+
+
+def _retain(*keep: Optional[ScoreTables]) -> None:
+    """Drop every cached artifact except ``keep`` (call with _lock held)"""
+    _compiled.clear()
+    _compiled.update((tables.version, tables) for tables in keep if tables is not None)
+
+
+def get_score_tables() -> ScoreTables:
+    """The active tables, loading the default file on first use"""
+    if _current is None:
+        reload_score_tables()
+    return _current
+
+
+def reload_score_tables(path: Optional[str] = None) -> ScoreTables:
+    """Load ``path`` and make it the active tables; the previous tables stay active on error"""
+    global _current, _previous, _current_stat
+    path = tables_path(path)
+    stat = path.stat()
+    tables = load_score_tables(path)
+    with _lock:
+        previous, _current = _current, tables
+        if tables is not previous:
+            _previous = previous
+        _retain(_current, _previous)
+        _current_stat = (str(path), stat.st_mtime_ns, stat.st_size)
+    if tables is not previous:
+        for listener in list(_listeners):
+            listener(tables)
+    return tables
+
+
+def reload_if_changed(path: Optional[str] = None) -> bool:
+    """Reload when the tables file changed since the last load; True if it did"""
+    path = tables_path(path)
+    stat = path.stat()
+    if _current_stat == (str(path), stat.st_mtime_ns, stat.st_size):
+        return False
+    previous = _current
+    return reload_score_tables(path) is not previous
+
+
+def on_reload(listener: Callable[[ScoreTables], None]) -> None:
+    """Call ``listener(tables)`` whenever different tables become active"""
+    _listeners.append(listener)
@@ -16,6 +16,7 @@ from typing import Dict, Any, Optional, Union, List
 
 import requests
 from bs4 import BeautifulSoup, Tag
+from utils.http_cache import cached_get
 
 from .coursera_scraper_utils import (
     extract_user_info,
@@ -488,7 +489,7 @@ class CourseraProfileScraper:
 
         try:
             logger.info(f"Scraping profile: {profile_url}")
-            response = self.session.get(profile_url, headers=self.headers, timeout=30)
+            response = cached_get(profile_url, session=self.session, headers=self.headers, timeout=30)
             response.raise_for_status()
 
             # Parse the HTML content
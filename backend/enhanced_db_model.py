@@ -6,7 +6,7 @@ import sqlite3
 import bcrypt
 import os
 import shutil
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, List, Tuple
 
 class EnhancedUserModel:
@@ -130,6 +130,20 @@ class EnhancedUserModel:
             )
         ''')
         
+        # Daily submission counts per user and platform (heatmap data)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS user_activity (
+                user_id INTEGER NOT NULL,
+                platform_id INTEGER NOT NULL,
+                activity_date DATE NOT NULL,
+                submission_count INTEGER NOT NULL DEFAULT 0 CHECK (submission_count >= 0),
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (user_id, platform_id, activity_date),
+                FOREIGN KEY (user_id) REFERENCES users_new (id) ON DELETE CASCADE,
+                FOREIGN KEY (platform_id) REFERENCES platforms (id)
+            )
+        ''')
+        
         # Enhanced institutions table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS institutions (
@@ -271,6 +285,9 @@ class EnhancedUserModel:
             "CREATE INDEX IF NOT EXISTS idx_rating_history_user_platform ON rating_history(user_platform_id)",
             "CREATE INDEX IF NOT EXISTS idx_rating_history_date ON rating_history(date_recorded)",
             
+            # Activity indexes (calendar range scans per user)
+            "CREATE INDEX IF NOT EXISTS idx_user_activity_user_date ON user_activity(user_id, activity_date)",
+            
             # Analytics indexes
             "CREATE INDEX IF NOT EXISTS idx_analytics_metric ON system_analytics(metric_name)",
             "CREATE INDEX IF NOT EXISTS idx_analytics_timestamp ON system_analytics(timestamp)",
@@ -490,6 +507,76 @@ class EnhancedUserModel:
             'last_active': row[5]
         } for i, row in enumerate(results)]
 
+    def upsert_user_activity(self, records: List[Tuple[int, str, str, int]]) -> int:
+        """Bulk insert or replace (user_id, platform_name, 'YYYY-MM-DD', count) rows"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT id, name FROM platforms")
+        platform_ids = {name.lower(): platform_id for platform_id, name in cursor.fetchall()}
+        
+        rows = []
+        for user_id, platform_name, activity_date, count in records:
+            platform_id = platform_ids.get(platform_name.lower())
+            if platform_id is None:
+                conn.close()
+                raise ValueError(f"Unknown platform: {platform_name}")
+            rows.append((user_id, platform_id, activity_date, int(count)))
+        
+        cursor.executemany('''
+            INSERT INTO user_activity (user_id, platform_id, activity_date, submission_count)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(user_id, platform_id, activity_date) DO UPDATE SET
+                submission_count = excluded.submission_count,
+                updated_at = CURRENT_TIMESTAMP
+        ''', rows)
+        
+        conn.commit()
+        conn.close()
+        return len(rows)
+    
+    def store_heatmap(self, user_id: int, platform_name: str, heatmap: Dict[str, int]) -> int:
+        """Persist one platform's {date_str: count} heatmap for a user"""
+        return self.upsert_user_activity(
+            [(user_id, platform_name, day, count) for day, count in heatmap.items()]
+        )
+    
+    def get_activity_calendars(self, user_ids: List[int], days: int = 365,
+                               end_date: Optional[str] = None) -> Dict[int, Dict[str, int]]:
+        """
+        Combined (all platforms) daily activity of many users in one query.
+        
+        Returns {user_id: {date_str: count}} for the ``days`` days ending at
+        ``end_date`` (default today); users without activity map to {}.
+        """
+        end = datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else datetime.now().date()
+        start = end - timedelta(days=days - 1)
+        calendars = {user_id: {} for user_id in user_ids}
+        if not calendars:
+            return calendars
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        placeholders = ','.join('?' * len(calendars))
+        cursor.execute(f'''
+            SELECT user_id, activity_date, SUM(submission_count)
+            FROM user_activity
+            WHERE user_id IN ({placeholders}) AND activity_date BETWEEN ? AND ?
+            GROUP BY user_id, activity_date
+            ORDER BY user_id, activity_date
+        ''', (*calendars, start.isoformat(), end.isoformat()))
+        
+        for user_id, activity_date, count in cursor.fetchall():
+            calendars[user_id][activity_date] = count
+        
+        conn.close()
+        return calendars
+    
+    def get_activity_calendar(self, user_id: int, days: int = 365,
+                              end_date: Optional[str] = None) -> Dict[str, int]:
+        """Combined daily activity of one user (see get_activity_calendars)"""
+        return self.get_activity_calendars([user_id], days, end_date)[user_id]
+
 if __name__ == "__main__":
     print("🚀 Initializing Enhanced Database System...")
     enhanced_db = EnhancedUserModel()
@@ -0,0 +1,67 @@
+"""
+Dense day-indexed activity arrays
+
+An activity array is a 1-D int64 numpy array whose element ``i`` holds the
+submission count of day ``ACTIVITY_ORIGIN + i``. Every platform and user
+shares the same origin, so combining platforms is array addition and the
+"last year" window is a slice; date strings are only parsed once, when a
+scraper's {date_str: count} dict is converted.
+"""
+import datetime
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# Before any of the supported judges kept per-day history
+ACTIVITY_ORIGIN = datetime.date(2008, 1, 1)
+_ORIGIN = np.datetime64(ACTIVITY_ORIGIN, 'D')
+
+Heatmap = Union[Dict[str, int], np.ndarray]
+
+
+def day_index(date: datetime.date) -> int:
+    """Position of ``date`` in an activity array"""
+    return (date - ACTIVITY_ORIGIN).days
+
+
+def to_activity_array(heatmap: Heatmap) -> np.ndarray:
+    """Convert a {'YYYY-MM-DD': count} dict (or an activity array) to an activity array"""
+    if isinstance(heatmap, np.ndarray):
+        return heatmap
+    if not heatmap:
+        return np.zeros(0, dtype=np.int64)
+    days = (np.array(list(heatmap.keys()), dtype='datetime64[D]') - _ORIGIN).astype(np.int64)
+    counts = np.fromiter(heatmap.values(), dtype=np.int64, count=len(heatmap))
+    keep = days >= 0
+    if not keep.any():
+        return np.zeros(0, dtype=np.int64)
+    return np.bincount(days[keep], weights=counts[keep]).astype(np.int64)
+
+
+def to_heatmap_dict(activity: np.ndarray) -> Dict[str, int]:
+    """Active days of an activity array as {'YYYY-MM-DD': count}"""
+    days = np.flatnonzero(activity)
+    labels = (_ORIGIN + days).astype(str).tolist()
+    return dict(zip(labels, activity[days].tolist()))
+
+
+def combine_activity(*activities: np.ndarray) -> np.ndarray:
+    """Element-wise sum of activity arrays of any lengths"""
+    combined = np.zeros(max((len(a) for a in activities), default=0), dtype=np.int64)
+    for activity in activities:
+        combined[:len(activity)] += activity
+    return combined
+
+
+def activity_window(activity: Heatmap, end_date: Optional[datetime.date] = None,
+                    days: int = 366) -> Tuple[np.ndarray, datetime.date]:
+    """The ``days`` counts ending at ``end_date`` (default today) and the first day's date"""
+    activity = to_activity_array(activity)
+    end_date = end_date or datetime.date.today()
+    start_date = end_date - datetime.timedelta(days=days - 1)
+    start = day_index(start_date)
+    window = np.zeros(days, dtype=np.int64)
+    lo, hi = max(start, 0), min(start + days, len(activity))
+    if hi > lo:
+        window[lo - start:hi - start] = activity[lo:hi]
+    return window, start_date
@@ -0,0 +1,171 @@
+"""
+Incremental Codeforces submission ingestion for heatmaps
+
+user.status returns a handle's submissions newest first. Instead of
+downloading the full history on every render, CodeforcesActivitySync keeps
+the newest submission id it has seen per user and handle, and adds the
+per-day counts of newer submissions to the user_activity table that
+EnhancedUserModel keeps for every platform. A sync pages through
+user.status only until it reaches an already-seen submission, so a repeat
+render costs one small request; the first sync of a handle replaces the
+user's Codeforces days outright. Pages bypass the shared response cache,
+since a cached page would hide the newest submissions. Days are UTC
+calendar days, like the other platforms' heatmaps.
+"""
+import datetime
+import sqlite3
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+CODEFORCES_STATUS_URL = "https://codeforces.com/api/user.status"
+PLATFORM_NAME = "codeforces"
+PAGE_SIZE = 100
+FULL_PAGE_SIZE = 10000
+
+FetchPage = Callable[[str, int, int], Optional[List[Dict]]]
+
+
+def fetch_status_page(handle: str, start: int, count: int) -> Optional[List[Dict]]:
+    """One user.status page (newest first), or None when the API reports an error"""
+    params = {'handle': handle, 'from': start, 'count': count}
+    try:
+        data = requests.get(CODEFORCES_STATUS_URL, params=params, timeout=30).json()
+    except (requests.RequestException, ValueError):
+        return None
+    if data.get('status') != 'OK':
+        return None
+    return data['result']
+
+
+def fetch_submissions(handle: str, last_id: Optional[int] = None, page_size: int = PAGE_SIZE,
+                      full_page_size: int = FULL_PAGE_SIZE,
+                      fetch_page: FetchPage = fetch_status_page) -> Optional[Dict[int, int]]:
+    """
+    {submission_id: creationTimeSeconds} of the submissions newer than
+    ``last_id`` (all of them when None), or None on an API error.
+    """
+    # A first sync takes the whole history in as few requests as possible
+    count = full_page_size if last_id is None else page_size
+
+    submissions = {}
+    start = 1
+    while True:
+        page = fetch_page(handle, start, count)
+        if page is None:
+            return None
+        reached_seen = False
+        for submission in page:
+            if last_id is not None and submission['id'] <= last_id:
+                reached_seen = True
+                break
+            submissions[submission['id']] = submission['creationTimeSeconds']
+        if reached_seen or len(page) < count:
+            return submissions
+        start += count
+
+
+def utc_daily_counts(timestamps) -> Dict[str, int]:
+    """{'YYYY-MM-DD': count} of Unix timestamps, bucketed by UTC day"""
+    daily = {}
+    for created in timestamps:
+        day = datetime.datetime.fromtimestamp(created, datetime.timezone.utc).date().isoformat()
+        daily[day] = daily.get(day, 0) + 1
+    return daily
+
+
+class CodeforcesActivitySync:
+    """Per-user Codeforces sync state on top of the user_activity table"""
+
+    def __init__(self, db, page_size: int = PAGE_SIZE, full_page_size: int = FULL_PAGE_SIZE):
+        # db is the EnhancedUserModel holding the user data (and its user_activity table)
+        self.db = db
+        self.db_path = db.db_path
+        self.page_size = page_size
+        self.full_page_size = full_page_size
+        self._init_tables()
+
+    def _init_tables(self):
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS codeforces_sync_state (
+                user_id INTEGER NOT NULL,
+                handle TEXT NOT NULL,
+                last_submission_id INTEGER NOT NULL,
+                synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (user_id, handle)
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def last_submission_id(self, user_id: int, handle: str) -> Optional[int]:
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT last_submission_id FROM codeforces_sync_state WHERE user_id = ? AND handle = ?",
+            (user_id, handle.lower())
+        ).fetchone()
+        conn.close()
+        return row[0] if row else None
+
+    def _fetch_page(self, handle: str, start: int, count: int) -> Optional[List[Dict]]:
+        return fetch_status_page(handle, start, count)
+
+    def sync(self, user_id: int, handle: str) -> Optional[int]:
+        """
+        Fetch the handle's submissions newer than the stored last id and add
+        them to the user's daily activity. The first sync of a handle (a new
+        user or a changed handle) replaces the user's Codeforces activity
+        with the handle's full history. Returns the number of new
+        submissions, or None on error.
+        """
+        last_id = self.last_submission_id(user_id, handle)
+        new_submissions = fetch_submissions(handle, last_id, self.page_size, self.full_page_size,
+                                            self._fetch_page)
+        if new_submissions is None:
+            return None
+        if not new_submissions and last_id is not None:
+            return 0
+
+        daily = utc_daily_counts(new_submissions.values())
+        newest_id = max(list(new_submissions) + [last_id or 0])
+
+        # Counts and the new last id are committed together, so an interrupted
+        # sync never adds the same submissions twice
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT id FROM platforms WHERE name = ?", (PLATFORM_NAME,))
+        platform_id = cursor.fetchone()[0]
+        if last_id is None:
+            # Full history of this handle: drop days counted for an earlier handle
+            cursor.execute("DELETE FROM user_activity WHERE user_id = ? AND platform_id = ?",
+                           (user_id, platform_id))
+            cursor.execute("DELETE FROM codeforces_sync_state WHERE user_id = ?", (user_id,))
+        cursor.executemany('''
+            INSERT INTO user_activity (user_id, platform_id, activity_date, submission_count)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(user_id, platform_id, activity_date) DO UPDATE SET
+                submission_count = submission_count + excluded.submission_count,
+                updated_at = CURRENT_TIMESTAMP
+        ''', [(user_id, platform_id, day, count) for day, count in daily.items()])
+        cursor.execute('''
+            INSERT OR REPLACE INTO codeforces_sync_state (user_id, handle, last_submission_id, synced_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (user_id, handle.lower(), newest_id))
+        conn.commit()
+        conn.close()
+        return len(new_submissions)
+
+    def daily_counts(self, user_id: int) -> Dict[str, int]:
+        """Stored {date_str: submission_count} of the user's Codeforces activity"""
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute('''
+            SELECT ua.activity_date, ua.submission_count
+            FROM user_activity ua
+            JOIN platforms p ON ua.platform_id = p.id
+            WHERE ua.user_id = ? AND p.name = ?
+            ORDER BY ua.activity_date
+        ''', (user_id, PLATFORM_NAME)).fetchall()
+        conn.close()
+        return dict(rows)
@@ -1,19 +1,17 @@
-import requests
 import datetime
-import time
-import pandas as pd
 import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 import numpy as np
-from bs4 import BeautifulSoup
 import json
-import re
-from matplotlib.colors import LinearSegmentedColormap
-import calendar
+from utils.http_cache import cached_post
+from rating_scraper_api.CodeChef_api import load_codechef_profile
+from heatmap.codeforces_sync import CodeforcesActivitySync, fetch_submissions, utc_daily_counts
+from heatmap.activity import activity_window, combine_activity, to_activity_array
+from heatmap.render import DAYS, HeatmapRenderer, render_heatmaps
+from heatmap.streaks import batch_streak_stats, streak_stats
 
 # ------------------ LeetCode Heatmap ------------------
 
-def get_leetcode_heatmap(username):
+def get_leetcode_heatmap(username, db=None, user_id=None):
     query = {
         "query": """
         query userCalendar($username: String!) {
@@ -27,221 +25,170 @@ def get_leetcode_heatmap(username):
         "variables": {"username": username}
     }
 
-    response = requests.post("https://leetcode.com/graphql", json=query)
+    response = cached_post("https://leetcode.com/graphql", json=query)
     data = response.json()
 
     try:
         submission_data = data['data']['matchedUser']['userCalendar']['submissionCalendar']
-        heatmap = {}
-        for timestamp, count in eval(submission_data).items():
-            date = datetime.datetime.fromtimestamp(int(timestamp)).date()
-            heatmap[str(date)] = int(count)
-        return heatmap
-    except:
+        heatmap = decode_submission_calendar(submission_data)
+    except (KeyError, TypeError, ValueError):
         print("LeetCode user not found or no data.")
         return {}
+    return store_heatmap(heatmap, "leetcode", db, user_id)
+
+def decode_submission_calendar(submission_calendar):
+    """Decode one submissionCalendar JSON string into {'YYYY-MM-DD': count}"""
+    return decode_submission_calendars([submission_calendar])[0]
+
+def decode_submission_calendars(submission_calendars):
+    """
+    Decode many submissionCalendar strings into one {'YYYY-MM-DD': count} per calendar.
+
+    The strings are parsed as JSON (never evaluated) and every timestamp of
+    the batch is converted to a UTC day in one vectorized datetime64 pass.
+    Raises ValueError for a calendar that is not a JSON object of integers.
+    """
+    keys, counts, sizes = [], [], []
+    for submission_calendar in submission_calendars:
+        calendar_data = json.loads(submission_calendar)
+        if not isinstance(calendar_data, dict):
+            raise ValueError("submissionCalendar is not a JSON object")
+        keys.extend(calendar_data.keys())
+        counts.extend(calendar_data.values())
+        sizes.append(len(calendar_data))
+
+    timestamps = np.array(keys, dtype=np.int64) if keys else np.zeros(0, dtype=np.int64)
+    # Calendars of a batch share most days: format each distinct day once
+    unique_days, day_index = np.unique(timestamps // 86400, return_inverse=True)
+    labels = unique_days.astype('datetime64[D]').astype(str).tolist()
+    days = [labels[i] for i in day_index.tolist()]
+    counts = np.array(counts, dtype=np.int64).tolist()
+
+    heatmaps = []
+    start = 0
+    for size in sizes:
+        heatmap = {}
+        for day, count in zip(days[start:start + size], counts[start:start + size]):
+            heatmap[day] = heatmap.get(day, 0) + count
+        heatmaps.append(heatmap)
+        start += size
+    return heatmaps
 
 # ------------------ Codeforces Heatmap ------------------
 
-def get_codeforces_heatmap(username):
-    url = f'https://codeforces.com/api/user.status?handle={username}&from=1&count=10000'
-    response = requests.get(url).json()
-    heatmap = {}
-    if response['status'] != 'OK':
+def get_codeforces_heatmap(username, db=None, user_id=None):
+    """
+    Daily Codeforces submissions of ``username``. Given the user's ``db`` and
+    ``user_id``, only submissions newer than the last sync are downloaded and
+    the counts are kept in the user's stored activity.
+    """
+    if db is not None and user_id is not None:
+        sync = CodeforcesActivitySync(db)
+        if sync.sync(user_id, username) is None:
+            print("Codeforces user not found or error.")
+            return {}
+        return sync.daily_counts(user_id)
+
+    submissions = fetch_submissions(username)
+    if submissions is None:
         print("Codeforces user not found or error.")
         return {}
-    for sub in response['result']:
-        date = datetime.datetime.fromtimestamp(sub['creationTimeSeconds']).date()
-        date_str = str(date)
-        heatmap[date_str] = heatmap.get(date_str, 0) + 1
-    return heatmap
+    return utc_daily_counts(submissions.values())
 
 # ------------------ CodeChef Heatmap ------------------
 
-def get_codechef_heatmap(username):
-    url = f"https://www.codechef.com/users/{username}"
-    response = requests.get(url)
-    soup = BeautifulSoup(response.content, "html.parser")
-    
-    script = soup.find("script", string=lambda s: s and "activityData" in s)
-    if not script:
-        print("CodeChef activityData not found.")
+def get_codechef_heatmap(username, db=None, user_id=None):
+    # Shares the single download + parse with fetch_codechef_profile
+    profile = load_codechef_profile(username)
+    if 'error' in profile:
+        print(f"CodeChef profile error: {profile['error']}")
         return {}
 
-    match = re.search(r'activityData\s*=\s*(\{.*?\});', script.string, re.DOTALL)
-    if not match:
-        print("CodeChef activityData parse error.")
+    heatmap = profile['activity_counts']
+    if heatmap is None:
+        print("CodeChef activityData not found.")
         return {}
+    return store_heatmap(dict(heatmap), "codechef", db, user_id)
+
+# ------------------ Stored Activity ------------------
 
-    raw_data = match.group(1)
-    data = json.loads(raw_data)
-    heatmap = {}
-    for entry in data.get('data', []):
-        date = entry['date']
-        count = entry['value']
-        heatmap[date] = heatmap.get(date, 0) + count
+def store_heatmap(heatmap, platform_name, db=None, user_id=None):
+    """Save a fetched heatmap into the user's stored activity (when a user is given) and return it"""
+    if heatmap and db is not None and user_id is not None:
+        db.store_heatmap(user_id, platform_name, heatmap)
     return heatmap
 
+HEATMAP_FETCHERS = {
+    'codeforces': get_codeforces_heatmap,
+    'leetcode': get_leetcode_heatmap,
+    'codechef': get_codechef_heatmap,
+}
+
+def stored_heatmap(db, user_id, end_date=None):
+    """The user's combined activity over the heatmap window, read from the database"""
+    end_date = end_date or datetime.date.today()
+    return db.get_activity_calendar(user_id, days=DAYS, end_date=end_date.isoformat())
+
+def stored_streak_stats(db, user_ids, end_date=None):
+    """{user_id: streak stats} over the heatmap window of many users' stored activity"""
+    end_date = end_date or datetime.date.today()
+    calendars = db.get_activity_calendars(user_ids, days=DAYS, end_date=end_date.isoformat())
+    counts = np.zeros((len(calendars), DAYS), dtype=np.int64)
+    for row, calendar in enumerate(calendars.values()):
+        counts[row] = activity_window(calendar, end_date, DAYS)[0]
+    stats = batch_streak_stats(counts)
+    return {user_id: {name: int(values[row]) for name, values in stats.items()}
+            for row, user_id in enumerate(calendars)}
+
+def render_stored_heatmaps(db, user_ids, output_dir, fmt="png", end_date=None, **kwargs):
+    """Render many users' stored activity (one query) to ``output_dir/<user_id>.<fmt>``"""
+    end_date = end_date or datetime.date.today()
+    calendars = db.get_activity_calendars(user_ids, days=DAYS, end_date=end_date.isoformat())
+    return render_heatmaps({str(user_id): calendar for user_id, calendar in calendars.items()},
+                           output_dir, fmt, end_date, **kwargs)
+
 # ------------------ Combine Heatmaps ------------------
 
 def combine_heatmaps(*heatmaps):
-    combined = {}
-    for heatmap in heatmaps:
-        for date, count in heatmap.items():
-            combined[date] = combined.get(date, 0) + count
-    return combined
+    """Sum per-platform heatmaps ({date_str: count} dicts or activity arrays) into one activity array"""
+    return combine_activity(*(to_activity_array(heatmap) for heatmap in heatmaps))
 
 # ------------------ Draw GitHub-style Heatmap ------------------
 
-def draw_github_style_heatmap(heatmap_data, title="Coding Activity"):
-    # Create a date range for the last year
-    today = datetime.date.today()
-    start_date = today - datetime.timedelta(days=365)
-    
-    # Create a list of all dates in the range
-    date_range = [start_date + datetime.timedelta(days=x) for x in range(366)]
-    
-    # Create a DataFrame with all dates
-    all_dates_df = pd.DataFrame({
-        'date': date_range,
-        'count': [heatmap_data.get(str(date), 0) for date in date_range]
-    })
-    
-    # Calculate additional columns
-    all_dates_df['weekday'] = all_dates_df['date'].apply(lambda x: x.weekday())
-    all_dates_df['week_number'] = all_dates_df['date'].apply(lambda x: (x - start_date).days // 7)
-    
-    # Create a pivot table for the heatmap
-    pivot_table = all_dates_df.pivot_table(
-        index='weekday', 
-        columns='week_number',
-        values='count', 
-        fill_value=0
-    )
-    
-    # Sort weekdays so Sunday is at the top (GitHub style)
-    pivot_table = pivot_table.sort_index(ascending=False)
-    
-    # Calculate max value for color scaling
-    max_value = max(all_dates_df['count'].max(), 1)  # Avoid division by zero
-    
-    # Create GitHub-like color map (white to darker green)
-    github_colors = ['#ebedf0', '#9be9a8', '#40c463', '#30a14e', '#216e39']
-    github_cmap = LinearSegmentedColormap.from_list('github', github_colors)
-    
-    # --- Custom Drawing with Borders and Spacing ---
-    fig, ax = plt.subplots(figsize=(16, 3))
-    fig.patch.set_facecolor('black')
-    ax.set_facecolor('black')
-    
-    n_weeks = pivot_table.shape[1]
-    n_days = 7  # Always 7 days in a week
-    
-    box_size = 1
-    gap = 0.15  # Small gap between boxes
-    
-    # Draw each box manually
-    for week in range(n_weeks):
-        for day in range(n_days):
-            count = pivot_table.iloc[day, week] if week in pivot_table.columns and day in pivot_table.index else 0
-            # Map count to color
-            if count == 0:
-                color = github_colors[0]
-            elif count < 4:
-                color = github_colors[1]
-            elif count < 10:
-                color = github_colors[2]
-            elif count < 20:
-                color = github_colors[3]
-            else:
-                color = github_colors[4]
-            rect = plt.Rectangle(
-                (week * (box_size + gap), day * (box_size + gap)),
-                box_size, box_size,
-                facecolor=color,
-                edgecolor='black',
-                linewidth=1.2
-            )
-            ax.add_patch(rect)
-    
-    # Set limits and invert y-axis so Sunday is at the top
-    ax.set_xlim(0, n_weeks * (box_size + gap))
-    ax.set_ylim(n_days * (box_size + gap), 0)
-    
-    # Remove all spines and ticks
-    for spine in ax.spines.values():
-        spine.set_visible(False)
-    ax.set_xticks([])
-    ax.set_yticks([])
-    
-    # Add month labels on top
-    month_labels = []
-    month_positions = []
-    for i, date in enumerate(date_range):
-        if date.day == 1:
-            month_labels.append(date.strftime('%b'))
-            month_positions.append((i // 7) * (box_size + gap))
-    ax.set_xticks(month_positions)
-    ax.set_xticklabels(month_labels, color='white')
-    ax.tick_params(axis='x', length=0, pad=5, colors='white')
-    
-    # Add weekday labels
-    weekday_labels = ['Mon', '', 'Wed', '', 'Fri', '', 'Sun']
-    ax.set_yticks([(i + 0.5) * (box_size + gap) for i in range(7)])
-    ax.set_yticklabels(weekday_labels, color='white')
-    ax.tick_params(axis='y', length=0, pad=10, colors='white')
-    
-    # Add legend
-    legend_labels = ['No contributions', '1-3 contributions', '4-9 contributions', 
-                     '10-19 contributions', '20+ contributions']
-    from matplotlib.patches import Patch
-    handles = [Patch(facecolor=color, edgecolor='black', linewidth=1.2) for color in github_colors]
-    plt.figlegend(handles, legend_labels, loc='upper center', 
-                  ncol=5, frameon=False, bbox_to_anchor=(0.5, 0), 
-                  bbox_transform=fig.transFigure, labelcolor='white')
-    
-    # Add title
-    plt.suptitle(title, fontsize=16, fontweight='bold', y=0.95, color='white')
-    
-    # Adjust layout
-    plt.subplots_adjust(top=0.85, bottom=0.2)
-    plt.tight_layout()
-    plt.show()
+def draw_github_style_heatmap(heatmap_data, title="Coding Activity", output=None, format=None):
+    """
+    Draw the last year of ``heatmap_data`` (a {date_str: count} dict or an
+    activity array) GitHub-style and return summary stats.
+
+    With ``output`` (a path or binary buffer) the image is rendered headlessly
+    and saved there; otherwise it is shown in a pyplot window.
+    """
+    counts, start_date = activity_window(heatmap_data, days=DAYS)
+
+    if output is None:
+        renderer = HeatmapRenderer(plt.figure(figsize=(16, 3)))
+        renderer.draw(counts, start_date, title)
+        plt.show()
+    else:
+        HeatmapRenderer().render(counts, start_date, output, title, format)
 
     # Return statistics for summary
-    total_contributions = all_dates_df['count'].sum()
-    active_days = (all_dates_df['count'] > 0).sum()
-    max_streak = calculate_max_streak(all_dates_df)
-    current_streak = calculate_current_streak(all_dates_df)
+    stats = streak_stats(counts)
     
     return {
-        'total_contributions': total_contributions,
-        'active_days': active_days,
-        'max_streak': max_streak,
-        'current_streak': current_streak
+        'total_contributions': stats['total'],
+        'active_days': stats['active_days'],
+        'max_streak': stats['max_streak'],
+        'current_streak': stats['current_streak']
     }
 
 def calculate_max_streak(df):
     """Calculate the longest streak of consecutive days with contributions."""
-    streak = 0
-    max_streak = 0
-    for _, row in df.sort_values('date').iterrows():
-        if row['count'] > 0:
-            streak += 1
-            max_streak = max(max_streak, streak)
-        else:
-            streak = 0
-    return max_streak
+    return streak_stats(df.sort_values('date')['count'].to_numpy())['max_streak']
 
 def calculate_current_streak(df):
     """Calculate the current streak of consecutive days with contributions."""
-    streak = 0
-    for _, row in df.sort_values('date', ascending=False).iterrows():
-        if row['count'] > 0:
-            streak += 1
-        else:
-            break
-    return streak
+    return streak_stats(df.sort_values('date')['count'].to_numpy())['current_streak']
 
 # ------------------ Main Execution with UI ------------------
 
@@ -286,7 +233,7 @@ def main():
     # Combine the heatmaps
     combined = combine_heatmaps(leet, cf, cc)
     
-    if not combined:
+    if not combined.any():
         print("\n❌ No activity data found. Please check your usernames and try again.")
         return
     
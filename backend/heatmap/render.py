@@ -0,0 +1,139 @@
+"""
+Headless GitHub-style heatmap rendering
+
+HeatmapRenderer draws a year of daily counts as a single PolyCollection on
+an Agg figure (no pyplot, no display needed) and writes PNG/SVG/PDF to a
+path or a file-like buffer. The figure, axes, legend and grid are built
+once; rendering another user only recolours the cells and swaps the title,
+so batches reuse one figure per process.
+"""
+import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+
+from heatmap.activity import Heatmap, activity_window
+
+GITHUB_COLORS = ['#ebedf0', '#9be9a8', '#40c463', '#30a14e', '#216e39']
+LEVEL_THRESHOLDS = [1, 4, 10, 20]
+LEGEND_LABELS = ['No contributions', '1-3 contributions', '4-9 contributions',
+                 '10-19 contributions', '20+ contributions']
+WEEKDAY_LABELS = ['Mon', '', 'Wed', '', 'Fri', '', 'Sun']
+DAYS = 366
+BOX_SIZE = 1
+GAP = 0.15
+
+
+class HeatmapRenderer:
+    """Reusable figure for drawing contribution heatmaps"""
+
+    def __init__(self, figure: Optional[Figure] = None, figsize: Tuple[float, float] = (16, 3)):
+        if figure is None:
+            figure = Figure(figsize=figsize)
+            FigureCanvasAgg(figure)
+        self.figure = figure
+        self.figure.patch.set_facecolor('black')
+        self.ax = self.figure.add_subplot()
+        self.ax.set_facecolor('black')
+        for spine in self.ax.spines.values():
+            spine.set_visible(False)
+        self.palette = np.array([to_rgba(color) for color in GITHUB_COLORS])
+
+        self.cells = PolyCollection([], edgecolors='black', linewidths=1.2)
+        self.ax.add_collection(self.cells)
+        self.ax.set_yticks([(i + 0.5) * (BOX_SIZE + GAP) for i in range(7)])
+        self.ax.set_yticklabels(WEEKDAY_LABELS, color='white')
+        self.ax.tick_params(axis='y', length=0, pad=10, colors='white')
+        self.ax.tick_params(axis='x', length=0, pad=5, colors='white')
+
+        handles = [Patch(facecolor=color, edgecolor='black', linewidth=1.2) for color in GITHUB_COLORS]
+        self.figure.legend(handles, LEGEND_LABELS, loc='upper center', ncol=5, frameon=False,
+                           bbox_to_anchor=(0.5, 0.12), labelcolor='white')
+        self.title = self.figure.suptitle('', fontsize=16, fontweight='bold', y=0.95, color='white')
+        self.figure.subplots_adjust(left=0.04, right=0.99, top=0.8, bottom=0.2)
+        self._range = None
+
+    def _layout(self, start_date: datetime.date, n_days: int):
+        """Cell geometry and month ticks; only rebuilt when the date range changes"""
+        if (start_date, n_days) == self._range:
+            return
+        self._range = (start_date, n_days)
+        index = np.arange(n_days)
+        week = index // 7
+        weekday = (start_date.weekday() + index) % 7
+        x = week * (BOX_SIZE + GAP)
+        y = weekday * (BOX_SIZE + GAP)
+        square = np.array([[0, 0], [BOX_SIZE, 0], [BOX_SIZE, BOX_SIZE], [0, BOX_SIZE]], dtype=float)
+        self.cells.set_verts(square[None, :, :] + np.stack([x, y], axis=1)[:, None, :])
+
+        n_weeks = int(week[-1]) + 1 if n_days else 0
+        self.ax.set_xlim(0, n_weeks * (BOX_SIZE + GAP))
+        self.ax.set_ylim(7 * (BOX_SIZE + GAP), 0)
+
+        first_days = [i for i in range(n_days)
+                      if (start_date + datetime.timedelta(days=i)).day == 1]
+        self.ax.set_xticks([(i // 7) * (BOX_SIZE + GAP) for i in first_days])
+        self.ax.set_xticklabels([(start_date + datetime.timedelta(days=i)).strftime('%b')
+                                 for i in first_days], color='white')
+
+    def draw(self, counts, start_date: datetime.date, title: str = "Coding Activity"):
+        """Colour the grid with ``counts`` (one entry per day from ``start_date``)"""
+        counts = np.asarray(counts)
+        self._layout(start_date, len(counts))
+        self.cells.set_facecolor(self.palette[np.digitize(counts, LEVEL_THRESHOLDS)])
+        self.title.set_text(title)
+
+    def render(self, counts, start_date: datetime.date, output, title: str = "Coding Activity",
+               format: Optional[str] = None):
+        """Draw and save to ``output`` (a path or a binary buffer; buffers default to PNG)"""
+        self.draw(counts, start_date, title)
+        if format is None and not isinstance(output, (str, os.PathLike)):
+            format = 'png'
+        self.figure.savefig(output, format=format, facecolor='black')
+        return output
+
+
+def _render_batch(items, output_dir, fmt, end_date, title_format):
+    renderer = HeatmapRenderer()
+    paths = {}
+    for name, heatmap_data in items:
+        counts, start_date = activity_window(heatmap_data, end_date, DAYS)
+        path = os.path.join(output_dir, f"{name}.{fmt}")
+        renderer.render(counts, start_date, path, title_format.format(name=name), fmt)
+        paths[name] = path
+    return paths
+
+
+def render_heatmaps(heatmaps: Union[Dict[str, Heatmap], Iterable[Tuple[str, Heatmap]]],
+                    output_dir: str, fmt: str = "png", end_date: Optional[datetime.date] = None,
+                    title_format: str = "{name}'s Coding Activity",
+                    processes: Optional[int] = None, chunk_size: int = 250) -> Dict[str, str]:
+    """
+    Render many users' heatmaps to ``output_dir/<name>.<fmt>``.
+
+    Heatmaps may be {date_str: count} dicts or activity arrays. Each
+    process reuses a single figure for all of its users; with
+    ``processes`` > 1 the users are split into chunks of ``chunk_size``
+    across a process pool. Returns {name: path}.
+    """
+    items = list(heatmaps.items()) if isinstance(heatmaps, dict) else list(heatmaps)
+    os.makedirs(output_dir, exist_ok=True)
+    end_date = end_date or datetime.date.today()
+    if not processes or processes <= 1 or len(items) <= chunk_size:
+        return _render_batch(items, output_dir, fmt, end_date, title_format)
+
+    paths = {}
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(_render_batch, chunk, output_dir, fmt, end_date, title_format)
+                   for chunk in chunks]
+        for future in futures:
+            paths.update(future.result())
+    return paths
@@ -0,0 +1,53 @@
+"""
+Run-length streak statistics over dense day-count arrays
+
+A row of ``counts`` holds one user's submissions per consecutive day, oldest
+first, with the last column being "today". Every statistic is computed for
+all rows at once from the boundaries of the active-day runs, so a whole
+leaderboard's "longest streak this year" is a handful of array operations.
+"""
+from typing import Dict
+
+import numpy as np
+
+
+def batch_streak_stats(counts) -> Dict[str, np.ndarray]:
+    """
+    Streak statistics for a (n_users, n_days) array of daily counts.
+
+    Returns arrays of length n_users: max_streak (longest run of active
+    days), current_streak (run ending on the last day), active_days and
+    total.
+    """
+    counts = np.asarray(counts)
+    if counts.ndim != 2:
+        raise ValueError("counts must be a 2-D (users x days) array")
+    n_users, n_days = counts.shape
+    active = counts > 0
+
+    # A False column on both sides of every row keeps runs from joining
+    # across rows once the array is flattened.
+    padded = np.zeros((n_users, n_days + 2), dtype=np.int8)
+    padded[:, 1:-1] = active
+    edges = np.diff(padded.ravel())
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    max_streak = np.zeros(n_users, dtype=np.int64)
+    np.maximum.at(max_streak, starts // (n_days + 2), ends - starts)
+
+    # Length of the trailing run: position of the last inactive day
+    inactive_from_end = np.argmin(active[:, ::-1], axis=1) if n_days else np.zeros(n_users, dtype=np.int64)
+    current_streak = np.where(active.all(axis=1), n_days, inactive_from_end).astype(np.int64)
+
+    return {
+        'max_streak': max_streak,
+        'current_streak': current_streak,
+        'active_days': active.sum(axis=1),
+        'total': counts.sum(axis=1),
+    }
+
+
+def streak_stats(counts) -> Dict[str, int]:
+    """Streak statistics of one user's 1-D daily count array, as plain ints"""
+    stats = batch_streak_stats(np.asarray(counts).reshape(1, -1))
+    return {name: int(values[0]) for name, values in stats.items()}
@@ -3,69 +3,166 @@ import numpy as np
 import math
 from datetime import datetime
 from collections import defaultdict
+from collections.abc import Mapping
+
+from logic_formulas.history import RatingLog, StatsHistory
+from logic_formulas.leaderboard import LeaderboardIndex
+from logic_formulas.rating_matrix import RatingMatrix
 
 class Platform:
-    def __init__(self, name, max_rating=5000):
+    def __init__(self, name, max_rating=5000, history_size=1000, rating_log_size=100_000):
         self.name = name
         self.max_rating = max_rating
         self.difficulty = None
         self.participation = None
         self.drift = None
         self.last_update = None
-        self.user_ratings = defaultdict(dict)
-        self.historical_stats = []
+        # Bounded stores: the oldest snapshots / observations are evicted.
+        self.history = StatsHistory(history_size, windows=(3, 5))
+        self.rating_log = RatingLog(rating_log_size)
+
+    @property
+    def historical_stats(self):
+        return self.history.records()
+
+    @property
+    def user_ratings(self):
+        return defaultdict(dict, self.rating_log.as_dict())
 
     def update_stats(self, difficulty, participation, current_ratings):
-        self.historical_stats.append({
-            'difficulty': difficulty,
-            'participation': participation,
-            'avg_rating': np.mean(list(current_ratings.values())) if current_ratings else 0,
-            'timestamp': datetime.now()
-        })
+        now = datetime.now()
+        ratings = np.fromiter(current_ratings.values(), dtype=float, count=len(current_ratings))
+        current_avg = ratings.mean() if len(ratings) else 0
+        self.history.append(difficulty, participation, current_avg, now.timestamp())
 
         self.difficulty = difficulty / self.max_rating
         self.participation = participation
-        self.drift = self._calculate_drift(current_ratings)
-        self.last_update = datetime.now()
+        self.drift = self._calculate_drift(current_avg if len(ratings) else None)
+        self.last_update = now
 
-        for user_id, rating in current_ratings.items():
-            self.user_ratings[user_id][datetime.now()] = rating
+        self.rating_log.extend(current_ratings.keys(), ratings, now.timestamp())
 
-    def _calculate_drift(self, current_ratings):
-        if not self.historical_stats or not current_ratings:
+    def _calculate_drift(self, current_avg):
+        if not len(self.history) or current_avg is None:
             return 0.0
-        hist_avg = np.mean([s['avg_rating'] for s in self.historical_stats[-5:]])
-        current_avg = np.mean(list(current_ratings.values()))
+        hist_avg = self.history.window_mean(5)
         return abs(current_avg - hist_avg) / self.max_rating
 
 
+class _MatrixValue:
+    """User score that lives in the system's RatingMatrix once the user is registered."""
+
+    def __init__(self, column):
+        self.column = column
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, user, owner=None):
+        if user is None:
+            return self
+        if user._matrix is None:
+            return user.__dict__.get(self.name, 0.0)
+        user._matrix.flush()
+        return float(getattr(user._matrix, self.column)[user._row])
+
+    def __set__(self, user, value):
+        if user._matrix is None:
+            user.__dict__[self.name] = value
+        else:
+            user._matrix.flush()
+            user._matrix.write(self.column, user._row, value)
+
+
 class User:
-    def __init__(self, user_id):
+    unified_rating = _MatrixValue('unified')
+    course_bonus = _MatrixValue('course_bonus')
+    total_rating = _MatrixValue('total')
+
+    def __init__(self, user_id, matrix=None, row=None):
         self.user_id = user_id
         self.platform_ratings = {}
         self.completed_courses = []
-        self.unified_rating = 0.0
-        self.course_bonus = 0.0
-        self.total_rating = 0.0
+        self._matrix = matrix
+        self._row = row
+        if matrix is None:
+            self.unified_rating = 0.0
+            self.course_bonus = 0.0
+            self.total_rating = 0.0
+
+
+class UserDirectory(Mapping):
+    """UnifiedRankingSystem.users: user_id -> User, in registration order.
+
+    Every user id registered in the matrix is a key; User objects for rows
+    that were never touched in this process (e.g. after load_snapshot) are
+    built on first access, with platform_ratings read back from the matrix.
+    """
+
+    def __init__(self, matrix):
+        self._matrix = matrix
+        self._users = {}
+
+    def __getitem__(self, user_id):
+        user = self._users.get(user_id)
+        if user is None:
+            user = self.at_row(self._matrix.user_index[user_id])
+        return user
+
+    def at_row(self, row):
+        """The User stored in matrix row ``row``."""
+        user_id = self._matrix.user_ids[row]
+        user = self._users.get(user_id)
+        if user is None:
+            user = self._users[user_id] = User(user_id, self._matrix, row)
+            user.platform_ratings = self._matrix.row_ratings(row)
+        return user
+
+    def __setitem__(self, user_id, user):
+        self._users[user_id] = user
+
+    def __contains__(self, user_id):
+        return user_id in self._matrix.user_index
+
+    def __iter__(self):
+        return iter(self._matrix.user_ids)
+
+    def __len__(self):
+        return self._matrix.size
 
 
 class UnifiedRankingSystem:
-    def __init__(self, alpha=0.5, beta=0.3, gamma=0.2, decay_lambda=0.01):
+    def __init__(self, alpha=0.5, beta=0.3, gamma=0.2, decay_lambda=0.01, incremental=False,
+                 weight_tolerance=0.005):
+        # incremental: recompute only the updated users while the platform
+        # weights stay the same, and defer the full recompute caused by a
+        # weight change until a score is read (or refresh() is called).
+        # Drift moves the weights a little on every stats update; as long as
+        # each platform's weight share stays within weight_tolerance
+        # (relative) of the shares the stored scores were computed with, the
+        # updated users are scored with those stored weights instead.
+        self.incremental = incremental
+        self.weight_tolerance = weight_tolerance
         self.alpha = alpha
         self.beta = beta
         self.gamma = gamma
         self.decay_lambda = decay_lambda
         self.platforms = {}
-        self.users = {}
         self.raw_weights = {}
         self.softmax_weights = {}
         self.final_weights = {}
+        self.matrix = RatingMatrix()
+        self.users = UserDirectory(self.matrix)
+        self.leaderboard = LeaderboardIndex(self.matrix)
 
-    def add_platform(self, platform_name, max_rating=5000):
-        self.platforms[platform_name] = Platform(platform_name, max_rating)
+    def add_platform(self, platform_name, max_rating=5000, history_size=1000, rating_log_size=100_000):
+        self.platforms[platform_name] = Platform(platform_name, max_rating, history_size=history_size,
+                                                 rating_log_size=rating_log_size)
+        self.matrix.add_platform(platform_name)
 
     def add_user(self, user_id):
-        self.users[user_id] = User(user_id)
+        row = self.matrix.add_user(user_id)
+        self.users[user_id] = User(user_id, self.matrix, row)
 
     def update_platform_stats(self, platform_name, difficulty, participation, current_ratings):
         if platform_name not in self.platforms:
@@ -73,13 +170,91 @@ class UnifiedRankingSystem:
         platform = self.platforms[platform_name]
         platform.update_stats(difficulty, participation, current_ratings)
 
+        rows = []
         for user_id, rating in current_ratings.items():
             if user_id not in self.users:
                 self.add_user(user_id)
-            self.users[user_id].platform_ratings[platform_name] = rating
+            user = self.users[user_id]
+            user.platform_ratings[platform_name] = rating
+            self.matrix.set_rating(user._row, platform_name, rating)
+            rows.append(user._row)
+
+        self._calculate_weights()
+        if self.incremental:
+            self._update_changed_ratings(rows)
+        else:
+            self._update_all_ratings()
+
+    def bulk_update(self, rows, platform_stats=None):
+        """Apply many (platform_name, user_id, rating) rows, then recompute once.
+
+        platform_stats maps a platform name to the (difficulty, participation)
+        of this snapshot; platforms missing from it keep their last values.
+        Each platform records a single history entry for the whole batch and,
+        if a user appears twice for one platform, the last row wins.
+        """
+        platform_stats = platform_stats or {}
+        snapshots = defaultdict(dict)
+        for platform_name, user_id, rating in rows:
+            snapshots[platform_name][user_id] = rating
+        if not snapshots:
+            return
+
+        stats = {}
+        for platform_name in snapshots:
+            if platform_name not in self.platforms:
+                raise ValueError(f"Platform {platform_name} not found")
+            platform = self.platforms[platform_name]
+            if platform_name in platform_stats:
+                stats[platform_name] = platform_stats[platform_name]
+            elif platform.difficulty is not None:
+                stats[platform_name] = (platform.difficulty * platform.max_rating, platform.participation)
+            else:
+                raise ValueError(f"No difficulty/participation given for platform {platform_name}")
+
+        for platform_name, current_ratings in snapshots.items():
+            difficulty, participation = stats[platform_name]
+            self.platforms[platform_name].update_stats(difficulty, participation, current_ratings)
+
+            user_ids = list(current_ratings)
+            new_rows = self.matrix.add_users(u for u in user_ids if u not in self.users)
+            for row in new_rows.tolist():
+                user_id = self.matrix.user_ids[row]
+                self.users[user_id] = User(user_id, self.matrix, row)
+            for user_id, rating in current_ratings.items():
+                self.users[user_id].platform_ratings[platform_name] = rating
+
+            matrix_rows = np.fromiter((self.matrix.user_index[u] for u in user_ids),
+                                      dtype=np.intp, count=len(user_ids))
+            self.matrix.set_ratings(matrix_rows, platform_name,
+                                    np.fromiter(current_ratings.values(), dtype=float, count=len(user_ids)))
 
         self._calculate_weights()
-        self._update_all_ratings()
+        if self.incremental:
+            fallbacks = {p: self._platform_fallback(p) for p in self.final_weights}
+            self.matrix.schedule(self.final_weights, fallbacks)
+        else:
+            self._update_all_ratings()
+
+    def refresh(self):
+        """Apply any deferred recompute so every user's scores are current."""
+        self.matrix.flush()
+
+    def save_snapshot(self, path):
+        """Write the full ranking state to a versioned binary snapshot."""
+        from logic_formulas.snapshot import save_snapshot
+        save_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path):
+        """Restore a system written by save_snapshot (arrays are memory-mapped)."""
+        from logic_formulas.snapshot import load_snapshot
+        system = load_snapshot(path)
+        # The stored weights carry the time decay of when the snapshot was
+        # written; recompute them for now and rescore if they moved.
+        system._calculate_weights()
+        system._apply_weights()
+        return system
 
     def _calculate_weights(self):
         self.raw_weights = {}
@@ -109,32 +284,60 @@ class UnifiedRankingSystem:
         valid_ratings = [r for p, r in user.platform_ratings.items() if p != platform_name]
         if valid_ratings:
             return np.mean(valid_ratings)
+        return self._platform_fallback(platform_name)
+
+    def _platform_fallback(self, platform_name):
         platform = self.platforms[platform_name]
-        if platform.historical_stats:
-            return np.mean([s['avg_rating'] for s in platform.historical_stats[-3:]])
+        if len(platform.history):
+            return platform.history.window_mean(3)
         return platform.max_rating * 0.5
 
     def _update_all_ratings(self):
-        for user in self.users.values():
-            unified_rating = 0.0
-            total_weight = 0.0
-            for platform_name, weight in self.final_weights.items():
-                rating = user.platform_ratings.get(platform_name)
-                if rating is None:
-                    rating = self._impute_missing_rating(user, platform_name)
-                unified_rating += weight * rating
-                total_weight += weight
-            user.unified_rating = unified_rating / total_weight if total_weight > 0 else 0
-            user.total_rating = user.unified_rating
+        fallbacks = {p: self._platform_fallback(p) for p in self.final_weights}
+        self.matrix.compute(self.final_weights, fallbacks)
 
-    def get_rankings(self, top_n=None):
-        sorted_users = sorted(self.users.values(), key=lambda u: -u.total_rating)
+    def _apply_weights(self):
+        """Recompute every user (deferred when incremental) unless the scores are current."""
+        fallbacks = {p: self._platform_fallback(p) for p in self.final_weights}
+        if self.matrix.is_current(self.final_weights, fallbacks, rtol=self.weight_tolerance):
+            return
+        if self.incremental:
+            self.matrix.schedule(self.final_weights, fallbacks)
+        else:
+            self.matrix.compute(self.final_weights, fallbacks)
+
+    def _update_changed_ratings(self, rows):
+        fallbacks = {p: self._platform_fallback(p) for p in self.final_weights}
+        if self.matrix.is_current(self.final_weights, rtol=self.weight_tolerance):
+            self.matrix.compute_changed(np.array(rows, dtype=np.intp), fallbacks)
+        else:
+            self.matrix.schedule(self.final_weights, fallbacks)
+
+    def _ranking_rows(self, rows):
         rankings = []
-        for user in sorted_users:
+        for row in rows.tolist():
+            user = self.users.at_row(row)
             rankings.append((
                 user.user_id,
                 user.unified_rating,
                 user.course_bonus,
                 user.total_rating
             ))
-        return rankings[:top_n] if top_n else rankings
\ No newline at end of file
+        return rankings
+
+    def get_rankings(self, top_n=None):
+        self.refresh()
+        rows = self.leaderboard.top(top_n) if top_n else self.leaderboard.order()
+        return self._ranking_rows(rows)
+
+    def get_rankings_range(self, first_rank, last_rank):
+        """Ranking tuples for leaderboard positions first_rank..last_rank (1-based, inclusive)."""
+        self.refresh()
+        return self._ranking_rows(self.leaderboard.range(max(first_rank, 1) - 1, last_rank))
+
+    def get_user_rank(self, user_id):
+        """1-based leaderboard position of user_id."""
+        if user_id not in self.users:
+            raise ValueError(f"User {user_id} not found")
+        self.refresh()
+        return self.leaderboard.rank(self.users[user_id]._row)
@@ -0,0 +1,124 @@
+import numpy as np
+from datetime import datetime
+
+
+class StatsHistory:
+    """Fixed-size ring buffer of platform snapshots.
+
+    Each row holds (difficulty, participation, avg_rating, timestamp); once
+    ``capacity`` snapshots are stored the oldest is overwritten. Means of the
+    last ``w`` avg_rating values for every ``w`` in ``windows`` are computed
+    on append, so readers get them in O(1).
+    """
+
+    FIELDS = ('difficulty', 'participation', 'avg_rating', 'timestamp')
+
+    def __init__(self, capacity=1000, windows=(3, 5)):
+        if capacity < max(windows, default=1):
+            raise ValueError("capacity must be at least the largest window")
+        self.capacity = capacity
+        self.windows = tuple(windows)
+        self.data = np.zeros((capacity, len(self.FIELDS)))
+        self.count = 0
+        self.window_means = {w: 0.0 for w in self.windows}
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, difficulty, participation, avg_rating, timestamp):
+        self.data[self.count % self.capacity] = (difficulty, participation, avg_rating, timestamp)
+        self.count += 1
+        for w in self.windows:
+            self.window_means[w] = float(self.tail('avg_rating', w).mean())
+
+    def tail(self, field, n):
+        """Last ``n`` stored values of ``field``, oldest first."""
+        n = min(n, len(self))
+        col = self.FIELDS.index(field)
+        idx = np.arange(self.count - n, self.count) % self.capacity
+        return self.data[idx, col]
+
+    def window_mean(self, n):
+        """Mean avg_rating of the last ``n`` snapshots."""
+        if n in self.window_means:
+            return self.window_means[n]
+        return float(self.tail('avg_rating', n).mean())
+
+    def records(self):
+        """Stored snapshots as dicts, oldest first."""
+        rows = self.data[np.arange(self.count - len(self), self.count) % self.capacity]
+        return [{
+            'difficulty': difficulty,
+            'participation': participation,
+            'avg_rating': avg_rating,
+            'timestamp': datetime.fromtimestamp(timestamp)
+        } for difficulty, participation, avg_rating, timestamp in rows.tolist()]
+
+
+class RatingLog:
+    """Fixed-size ring buffer of (user, timestamp, rating) observations.
+
+    User ids are interned to integer keys so the log itself is three flat
+    arrays; the oldest observations are evicted once ``capacity`` is reached.
+    """
+
+    def __init__(self, capacity=100_000):
+        self.capacity = capacity
+        self._user_keys = {}
+        self.user_ids = []
+        self.users = np.zeros(capacity, dtype=np.int64)
+        self.timestamps = np.zeros(capacity)
+        self.ratings = np.zeros(capacity)
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    @property
+    def user_keys(self):
+        # Built lazily from user_ids when restored from a snapshot.
+        if self._user_keys is None:
+            self._user_keys = dict(zip(self.user_ids, range(len(self.user_ids))))
+        return self._user_keys
+
+    def _key(self, user_id):
+        user_keys = self.user_keys
+        key = user_keys.get(user_id)
+        if key is None:
+            key = user_keys[user_id] = len(self.user_ids)
+            self.user_ids.append(user_id)
+        return key
+
+    def extend(self, user_ids, ratings, timestamp):
+        keys = np.fromiter((self._key(u) for u in user_ids), dtype=np.int64)
+        ratings = np.asarray(ratings, dtype=float)
+        if len(keys) > self.capacity:
+            self.count += len(keys) - self.capacity
+            keys, ratings = keys[-self.capacity:], ratings[-self.capacity:]
+        idx = np.arange(self.count, self.count + len(keys)) % self.capacity
+        self.users[idx] = keys
+        self.timestamps[idx] = timestamp
+        self.ratings[idx] = ratings
+        self.count += len(keys)
+
+    def _ordered(self):
+        return np.arange(self.count - len(self), self.count) % self.capacity
+
+    def history(self, user_id):
+        """Retained (datetime, rating) observations of one user, oldest first."""
+        key = self.user_keys.get(user_id)
+        if key is None:
+            return []
+        idx = self._ordered()
+        idx = idx[self.users[idx] == key]
+        return [(datetime.fromtimestamp(t), r)
+                for t, r in zip(self.timestamps[idx].tolist(), self.ratings[idx].tolist())]
+
+    def as_dict(self):
+        """All retained observations as {user_id: {datetime: rating}}."""
+        result = {}
+        idx = self._ordered()
+        for key, t, r in zip(self.users[idx].tolist(), self.timestamps[idx].tolist(),
+                             self.ratings[idx].tolist()):
+            result.setdefault(self.user_ids[key], {})[datetime.fromtimestamp(t)] = r
+        return result
@@ -0,0 +1,65 @@
+import numpy as np
+
+
+class LeaderboardIndex:
+    """Rank queries over ``RatingMatrix.total`` without sorting every user.
+
+    Ordering matches ``sorted(users, key=lambda u: -u.total_rating)``: higher
+    totals first, ties broken by registration order (matrix row). Top-N and
+    rank-range queries use ``np.partition`` (O(N + K log K)); a full order is
+    only built when all users are requested, and it is reused until the
+    matrix changes.
+    """
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self._order = None
+        self._order_version = None
+
+    def _scores(self):
+        return self.matrix.total[:self.matrix.size]
+
+    def _cached_order(self):
+        if self._order is not None and self._order_version == self.matrix.version:
+            return self._order
+        return None
+
+    def order(self):
+        """Matrix rows of every user, best first."""
+        order = self._cached_order()
+        if order is None:
+            scores = self._scores()
+            order = np.argsort(-scores, kind='stable')
+            self._order, self._order_version = order, self.matrix.version
+        return order
+
+    def top(self, k):
+        """Matrix rows of the best ``k`` users, best first."""
+        order = self._cached_order()
+        if order is not None:
+            return order[:k]
+        scores = self._scores()
+        n = len(scores)
+        if k >= n:
+            return self.order()
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        kth = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        rows = np.concatenate([above, ties])
+        return rows[np.lexsort((rows, -scores[rows]))]
+
+    def range(self, start, stop):
+        """Matrix rows holding 0-based leaderboard positions ``start`` to ``stop - 1``."""
+        order = self._cached_order()
+        if order is not None:
+            return order[start:stop]
+        return self.top(stop)[start:]
+
+    def rank(self, row):
+        """1-based leaderboard position of the user stored in ``row``."""
+        scores = self._scores()
+        score = scores[row]
+        return int(np.count_nonzero(scores > score) + np.count_nonzero(scores[:row] == score)) + 1
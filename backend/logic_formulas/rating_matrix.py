@@ -0,0 +1,190 @@
+import math
+
+import numpy as np
+
+
+class RatingMatrix:
+    """Dense users x platforms rating store with a missing-value mask.
+
+    Row ``i`` belongs to ``user_ids[i]`` and column ``j`` to the j-th platform
+    registered with ``add_platform``. Missing cells hold 0.0 and a False mask
+    entry, so row sums over ``ratings`` only ever see known ratings.
+    """
+
+    def __init__(self, capacity=1024):
+        self.platform_index = {}
+        self._user_index = {}
+        self.user_ids = []
+        self.size = 0
+        self.ratings = np.zeros((capacity, 0))
+        self.mask = np.zeros((capacity, 0), dtype=bool)
+        self.unified = np.zeros(capacity)
+        self.course_bonus = np.zeros(capacity)
+        self.total = np.zeros(capacity)
+        self.weights = {}
+        self.fallbacks = {}
+        self.pending = None
+        # Bumped whenever a user's total changes, so rank indexes know to rebuild.
+        self.version = 0
+
+    @property
+    def user_index(self):
+        # Built lazily from user_ids when restored from a snapshot.
+        if self._user_index is None:
+            self._user_index = dict(zip(self.user_ids, range(len(self.user_ids))))
+        return self._user_index
+
+    def add_platform(self, platform_name):
+        if platform_name in self.platform_index:
+            return self.platform_index[platform_name]
+        col = len(self.platform_index)
+        self.platform_index[platform_name] = col
+        rows = self.ratings.shape[0]
+        self.ratings = np.hstack([self.ratings, np.zeros((rows, 1))])
+        self.mask = np.hstack([self.mask, np.zeros((rows, 1), dtype=bool)])
+        return col
+
+    def add_user(self, user_id):
+        self.version += 1
+        row = self.user_index.get(user_id)
+        if row is not None:
+            self.ratings[row] = 0.0
+            self.mask[row] = False
+            self.unified[row] = self.course_bonus[row] = self.total[row] = 0.0
+            return row
+        if self.size == self.ratings.shape[0]:
+            self._grow(max(2 * self.size, 1024))
+        row = self.size
+        self.size += 1
+        self.user_index[user_id] = row
+        self.user_ids.append(user_id)
+        return row
+
+    def add_users(self, user_ids):
+        """Register many new user ids at once and return their rows."""
+        new_ids = [u for u in dict.fromkeys(user_ids) if u not in self.user_index]
+        self.version += 1
+        needed = self.size + len(new_ids)
+        if needed > self.ratings.shape[0]:
+            self._grow(max(2 * self.ratings.shape[0], needed))
+        start = self.size
+        self.user_index.update(zip(new_ids, range(start, needed)))
+        self.user_ids.extend(new_ids)
+        self.size = needed
+        return np.arange(start, needed)
+
+    def _grow(self, capacity):
+        def resized(array):
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            return grown
+
+        self.ratings = resized(self.ratings)
+        self.mask = resized(self.mask)
+        self.unified = resized(self.unified)
+        self.course_bonus = resized(self.course_bonus)
+        self.total = resized(self.total)
+
+    def write(self, column, row, value):
+        getattr(self, column)[row] = value
+        if column == 'total':
+            self.version += 1
+
+    def set_rating(self, row, platform_name, rating):
+        col = self.platform_index[platform_name]
+        if rating is None:
+            self.ratings[row, col] = 0.0
+            self.mask[row, col] = False
+        else:
+            self.ratings[row, col] = rating
+            self.mask[row, col] = True
+
+    def set_ratings(self, rows, platform_name, ratings):
+        col = self.platform_index[platform_name]
+        self.ratings[rows, col] = ratings
+        self.mask[rows, col] = True
+
+    def row_ratings(self, row):
+        """Known ratings of one user as {platform_name: rating}."""
+        known = {}
+        for platform_name, col in self.platform_index.items():
+            if self.mask[row, col]:
+                rating = float(self.ratings[row, col])
+                known[platform_name] = int(rating) if rating.is_integer() else rating
+        return known
+
+    def is_current(self, weights, fallbacks=None, rtol=0.0):
+        """True when the stored scores were computed with these inputs.
+
+        Scores only depend on each platform's share of the total weight, so
+        the shares are compared, each within relative tolerance ``rtol``.
+        ``fallbacks``, when given, must match exactly.
+        """
+        if self.pending is not None or weights.keys() != self.weights.keys():
+            return False
+        if fallbacks is not None and fallbacks != self.fallbacks:
+            return False
+        total, stored_total = sum(weights.values()), sum(self.weights.values())
+        if not total or not stored_total:
+            return total == stored_total
+        return all(math.isclose(weight / total, self.weights[p] / stored_total, rel_tol=rtol)
+                   for p, weight in weights.items())
+
+    def compute_changed(self, rows, fallbacks):
+        """Rescore ``rows`` with the stored weights and switch to new ``fallbacks``.
+
+        Fallbacks only reach users without any rating, so those users are
+        rescored too; afterwards every stored score matches
+        (``self.weights``, ``fallbacks``) again.
+        """
+        unrated = np.flatnonzero(~self.mask[:self.size].any(axis=1))
+        self.fallbacks = dict(fallbacks)
+        self.compute(self.weights, self.fallbacks, rows=np.union1d(rows, unrated))
+
+    def schedule(self, weights, fallbacks):
+        """Defer a full recompute until the next ``flush``."""
+        self.pending = (dict(weights), dict(fallbacks))
+
+    def flush(self):
+        if self.pending is not None:
+            weights, fallbacks = self.pending
+            self.pending = None
+            self.compute(weights, fallbacks)
+
+    def compute(self, weights, fallbacks, rows=None):
+        """Recompute ``unified`` (and reset ``total``) for ``rows`` or every user.
+
+        ``weights`` maps platform name to its final weight and ``fallbacks``
+        maps the same platforms to the rating imputed for users that have no
+        ratings at all. Users with at least one rating are imputed with the
+        mean of their known ratings, matching
+        ``UnifiedRankingSystem._impute_missing_rating``.
+        """
+        self.version += 1
+        if rows is None:
+            rows = slice(0, self.size)
+            self.weights = dict(weights)
+            self.fallbacks = dict(fallbacks)
+        if not weights:
+            self.unified[rows] = 0.0
+            self.total[rows] = 0.0
+            return
+
+        cols = [self.platform_index[p] for p in weights]
+        w = np.fromiter(weights.values(), dtype=float, count=len(cols))
+        fallback = np.fromiter((fallbacks[p] for p in weights), dtype=float, count=len(cols))
+        total_weight = w.sum()
+
+        ratings = self.ratings[rows]
+        mask = self.mask[rows]
+        counts = mask.sum(axis=1)
+        has_ratings = counts > 0
+        user_mean = np.divide(ratings.sum(axis=1), counts,
+                              out=np.zeros(len(counts)), where=has_ratings)
+
+        imputed = np.where(has_ratings[:, None], user_mean[:, None], fallback)
+        filled = np.where(mask[:, cols], ratings[:, cols], imputed)
+
+        unified = filled @ w / total_weight if total_weight > 0 else 0.0
+        self.unified[rows] = unified
+        self.total[rows] = unified
@@ -0,0 +1,244 @@
+"""
+Binary snapshots of UnifiedRankingSystem state
+
+Layout (little-endian):
+    8 bytes   magic b"URSNAP\\0\\0"
+    4 bytes   format version (uint32)
+    8 bytes   header length (uint64)
+    header    UTF-8 JSON: scalars, weights, platform metadata and the
+              dtype/shape/offset of every array
+              (user id lists are stored as arrays too, see _encode_ids)
+    arrays    raw array data, each aligned to 64 bytes
+
+load_snapshot memory-maps the array section copy-on-write, so a warm start
+only parses the header; array pages are read on first use and later writes
+never touch the file.
+"""
+import json
+import os
+import struct
+from datetime import datetime
+
+import numpy as np
+
+from logic_formulas.formula_main import Platform, UnifiedRankingSystem
+
+MAGIC = b"URSNAP\0\0"
+SNAPSHOT_VERSION = 1
+_PREAMBLE = struct.Struct("<8sIQ")
+_ALIGN = 64
+
+
+def _aligned(offset):
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _encode_ids(ids):
+    """Pack a user id list into a uint8 array (NUL-joined UTF-8 when possible)."""
+    if all(isinstance(i, str) and '\0' not in i for i in ids):
+        encoding, blob = 'nul-joined', '\0'.join(ids)
+    else:
+        encoding, blob = 'json', json.dumps(ids)
+    return encoding, np.frombuffer(blob.encode('utf-8'), dtype=np.uint8)
+
+
+def _decode_ids(encoding, array):
+    text = array.tobytes().decode('utf-8')
+    if encoding == 'json':
+        return json.loads(text)
+    return text.split('\0') if text else []
+
+
+def _collect(system):
+    """Header metadata and {name: array} for everything that needs saving."""
+    matrix = system.matrix
+    n = matrix.size
+    arrays = {
+        'matrix.ratings': matrix.ratings[:n],
+        'matrix.mask': matrix.mask[:n],
+        'matrix.unified': matrix.unified[:n],
+        'matrix.course_bonus': matrix.course_bonus[:n],
+        'matrix.total': matrix.total[:n],
+    }
+    id_encodings = {}
+    id_encodings['matrix.user_ids'], arrays['matrix.user_ids'] = _encode_ids(matrix.user_ids)
+    platforms = []
+    for i, platform in enumerate(system.platforms.values()):
+        history, log = platform.history, platform.rating_log
+        arrays[f'platform{i}.history'] = history.data
+        arrays[f'platform{i}.log_users'] = log.users
+        arrays[f'platform{i}.log_timestamps'] = log.timestamps
+        arrays[f'platform{i}.log_ratings'] = log.ratings
+        ids_name = f'platform{i}.log_user_ids'
+        id_encodings[ids_name], arrays[ids_name] = _encode_ids(log.user_ids)
+        platforms.append({
+            'name': platform.name,
+            'max_rating': platform.max_rating,
+            'difficulty': platform.difficulty,
+            'participation': platform.participation,
+            'drift': platform.drift,
+            'last_update': platform.last_update.isoformat() if platform.last_update else None,
+            'history': {
+                'capacity': history.capacity,
+                'count': history.count,
+                'windows': list(history.windows),
+                'window_means': list(history.window_means.items()),
+            },
+            'rating_log': {
+                'capacity': log.capacity,
+                'count': log.count,
+            },
+        })
+
+    header = {
+        'system': {
+            'alpha': system.alpha,
+            'beta': system.beta,
+            'gamma': system.gamma,
+            'decay_lambda': system.decay_lambda,
+            'incremental': system.incremental,
+            'weight_tolerance': system.weight_tolerance,
+            'raw_weights': system.raw_weights,
+            'softmax_weights': system.softmax_weights,
+            'final_weights': system.final_weights,
+        },
+        'platforms': platforms,
+        'id_encodings': id_encodings,
+        'matrix': {
+            'platforms': list(matrix.platform_index),
+            'weights': matrix.weights,
+            'fallbacks': matrix.fallbacks,
+        },
+    }
+    return header, arrays
+
+
+def save_snapshot(system, path):
+    """Write ``system`` to ``path`` (atomically, via a temporary file)."""
+    system.refresh()
+    header, arrays = _collect(system)
+
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        offset = _aligned(offset)
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset += array.nbytes
+    header['arrays'] = layout
+    header_bytes = json.dumps(header, default=float).encode('utf-8')
+    data_start = _aligned(_PREAMBLE.size + len(header_bytes))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREAMBLE.pack(MAGIC, SNAPSHOT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(data_start + offset)
+    # A system restored from ``path`` still maps it; Windows cannot replace a
+    # mapped file, so move those arrays into memory first.
+    _release_mappings(system)
+    os.replace(tmp_path, path)
+
+
+def _owned(array):
+    """``array`` itself, or an in-memory copy when it views a memory-mapped file."""
+    base = array
+    while base is not None:
+        if isinstance(base, np.memmap):
+            return np.array(array)
+        base = base.base
+    return array
+
+
+def _release_mappings(system):
+    """Replace every snapshot-mapped array of ``system`` with an in-memory copy."""
+    for platform in system.platforms.values():
+        history, log = platform.history, platform.rating_log
+        history.data = _owned(history.data)
+        log.users = _owned(log.users)
+        log.timestamps = _owned(log.timestamps)
+        log.ratings = _owned(log.ratings)
+    matrix = system.matrix
+    for name in ('ratings', 'mask', 'unified', 'course_bonus', 'total'):
+        setattr(matrix, name, _owned(getattr(matrix, name)))
+
+
+def _read_header(path):
+    with open(path, 'rb') as f:
+        magic, version, header_len = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a ranking snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version} (expected {SNAPSHOT_VERSION})")
+        header = json.loads(f.read(header_len).decode('utf-8'))
+    return header, _aligned(_PREAMBLE.size + header_len)
+
+
+def load_snapshot(path):
+    """Rebuild a UnifiedRankingSystem from a snapshot written by save_snapshot."""
+    header, data_start = _read_header(path)
+    size = os.path.getsize(path)
+    buffer = np.memmap(path, dtype=np.uint8, mode='c') if size > data_start else None
+
+    def array(name):
+        spec = header['arrays'][name]
+        dtype = np.dtype(spec['dtype'])
+        count = int(np.prod(spec['shape']))
+        if count == 0:
+            return np.zeros(spec['shape'], dtype=dtype)
+        start = data_start + spec['offset']
+        return buffer[start:start + count * dtype.itemsize].view(dtype).reshape(spec['shape'])
+
+    def user_ids(name):
+        return _decode_ids(header['id_encodings'][name], array(name))
+
+    meta = header['system']
+    system = UnifiedRankingSystem(meta['alpha'], meta['beta'], meta['gamma'],
+                                  meta['decay_lambda'], incremental=meta['incremental'],
+                                  weight_tolerance=meta.get('weight_tolerance', 0.0))
+    system.raw_weights = meta['raw_weights']
+    system.softmax_weights = meta['softmax_weights']
+    system.final_weights = meta['final_weights']
+
+    for i, info in enumerate(header['platforms']):
+        history_info, log_info = info['history'], info['rating_log']
+        platform = Platform(info['name'], info['max_rating'],
+                            history_size=history_info['capacity'],
+                            rating_log_size=log_info['capacity'])
+        platform.difficulty = info['difficulty']
+        platform.participation = info['participation']
+        platform.drift = info['drift']
+        if info['last_update']:
+            platform.last_update = datetime.fromisoformat(info['last_update'])
+
+        history = platform.history
+        history.windows = tuple(history_info['windows'])
+        history.data = array(f'platform{i}.history')
+        history.count = history_info['count']
+        history.window_means = {int(w): m for w, m in history_info['window_means']}
+
+        log = platform.rating_log
+        log.users = array(f'platform{i}.log_users')
+        log.timestamps = array(f'platform{i}.log_timestamps')
+        log.ratings = array(f'platform{i}.log_ratings')
+        log.count = log_info['count']
+        log.user_ids = user_ids(f'platform{i}.log_user_ids')
+        log._user_keys = None
+        system.platforms[platform.name] = platform
+
+    matrix = system.matrix
+    matrix_meta = header['matrix']
+    matrix.platform_index = {name: col for col, name in enumerate(matrix_meta['platforms'])}
+    matrix.user_ids = user_ids('matrix.user_ids')
+    matrix._user_index = None
+    matrix.size = len(matrix.user_ids)
+    matrix.ratings = array('matrix.ratings')
+    matrix.mask = array('matrix.mask')
+    matrix.unified = array('matrix.unified')
+    matrix.course_bonus = array('matrix.course_bonus')
+    matrix.total = array('matrix.total')
+    matrix.weights = matrix_meta['weights']
+    matrix.fallbacks = matrix_meta['fallbacks']
+    return system
@@ -4,15 +4,8 @@ from rating_scraper_api.leetcode_api import fetch_leetcode_profile
 from rating_scraper_api.CodeChef_api import fetch_codechef_profile
 # from course_credential_manager import CourseCredentialManager
 # from cousera.main_scrapper import run_scraper
-from cousera.run import run_interactive
-from heatmap.heat_map import (
-    get_codeforces_heatmap,
-    get_leetcode_heatmap,
-    get_codechef_heatmap,
-    combine_heatmaps,
-    draw_github_style_heatmap,
-)
-from bonus_calculatorF import bonus_calculator
+# The heatmap (matplotlib/numpy), Coursera and bonus modules are imported
+# where run() first needs them, so the prompts appear without delay.
 
 
 def run():
@@ -173,6 +166,13 @@ def run():
     # heatmap section
 
     print("\n===== Fetching User Activity Data (Heatmaps) =====")
+    from heatmap.heat_map import (
+        get_codeforces_heatmap,
+        get_leetcode_heatmap,
+        get_codechef_heatmap,
+        combine_heatmaps,
+        draw_github_style_heatmap,
+    )
     cf_heatmap = get_codeforces_heatmap(handle_CF)
     lc_heatmap = get_leetcode_heatmap(handle_LC)
     cc_heatmap = get_codechef_heatmap(handle_CC)
@@ -188,6 +188,8 @@ def run():
     if not profile_url:
         print("No URL provided. Exiting.")
         return
+    from cousera.run import run_interactive
+    from bonus_calculatorF import bonus_calculator
     course_data = run_interactive(profile_url)
     
     # Get the updated global bonus sum
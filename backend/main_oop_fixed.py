@@ -12,16 +12,8 @@ sys.path.append(str(backend_dir))
 from services.enhanced_auth_service import EnhancedAuthService
 from services.user_input_handler import UserInputHandler
 from services.ranking_service import EnhancedRankingSystem
-from heatmap.heat_map import (
-    get_codeforces_heatmap,
-    get_leetcode_heatmap,
-    get_codechef_heatmap,
-    combine_heatmaps,
-    draw_github_style_heatmap,
-)
-# Import Coursera scraping functionality
-from cousera.coursera_scraper import scrape_coursera_profile, validate_coursera_url
-from bonus_calculatorF.bonus_calculator import calculate_from_scraper_result
+# Heatmap (matplotlib/numpy), Coursera scraping and the bonus calculator are
+# imported inside the handlers that use them, so startup stays fast.
 
 class FixedUnifiedRankingApp:
     """Fixed version of the main application class"""
@@ -278,6 +270,9 @@ class FixedUnifiedRankingApp:
             print("Extract course data from your public Coursera profile")
             print("Example URL: https://www.coursera.org/user/your-username")
             
+            from cousera.coursera_scraper import scrape_coursera_profile, validate_coursera_url
+            from bonus_calculatorF.bonus_calculator import calculate_from_scraper_result
+            
             # Get Coursera profile URL
             profile_url = input("\nEnter your Coursera profile URL: ").strip()
             
@@ -429,41 +424,35 @@ class FixedUnifiedRankingApp:
                 self.input_handler.pause_for_user()
                 return
             
-            heatmaps = []
+            from enhanced_db_model import EnhancedUserModel
+            from heatmap.heat_map import HEATMAP_FETCHERS, draw_github_style_heatmap, stored_heatmap
+            
+            db = EnhancedUserModel(self.auth_service.db_path)
+            user_id = self.auth_service.get_current_user()['id']
             
             for platform_data in platforms:
                 platform_name = platform_data['platform_name']
                 handle = platform_data['handle']
+                fetch_heatmap = HEATMAP_FETCHERS.get(platform_name.lower())
+                if fetch_heatmap is None:
+                    print(f"⚠️ Heatmap not available for {platform_name}")
+                    continue
                 
                 print(f"🔄 Fetching {platform_name} heatmap for {handle}...")
                 
                 try:
-                    if platform_name.lower() == 'codeforces':
-                        heatmap_data = get_codeforces_heatmap(handle)
-                        if heatmap_data:
-                            heatmaps.append(heatmap_data)
-                    elif platform_name.lower() == 'leetcode':
-                        heatmap_data = get_leetcode_heatmap(handle)
-                        if heatmap_data:
-                            heatmaps.append(heatmap_data)
-                    elif platform_name.lower() == 'codechef':
-                        heatmap_data = get_codechef_heatmap(handle)
-                        if heatmap_data:
-                            heatmaps.append(heatmap_data)
-                    else:
-                        print(f"⚠️ Heatmap not available for {platform_name}")
-                        
+                    # Fetched days are saved to the user's stored activity
+                    fetch_heatmap(handle, db=db, user_id=user_id)
                 except Exception as e:
                     print(f"❌ Failed to fetch {platform_name} heatmap: {e}")
             
-            if heatmaps:
-                print("🔄 Combining heatmaps...")
+            # Render from the stored activity, so platforms that could not be
+            # fetched this time still show their last synced days
+            heatmap = stored_heatmap(db, user_id)
+            if heatmap:
+                print("🔄 Generating visualization...")
                 try:
-                    # Fix: Pass individual heatmaps as arguments, not as a list
-                    combined_heatmap = combine_heatmaps(*heatmaps)
-                    
-                    print("🔄 Generating visualization...")
-                    draw_github_style_heatmap(combined_heatmap)
+                    draw_github_style_heatmap(heatmap)
                     print("✅ Heatmap generated successfully!")
                 except Exception as e:
                     print(f"❌ Failed to generate heatmap visualization: {e}")
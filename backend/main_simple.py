@@ -3,6 +3,7 @@ Simple Main Application - Fixes password input issues
 """
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add the backend directory to the Python path
@@ -12,13 +13,9 @@ sys.path.append(str(backend_dir))
 from services.enhanced_auth_service import EnhancedAuthService
 from services.simple_input_handler import SimpleUserInputHandler
 
-# Import Coursera scraping functionality
-try:
-    from cousera.coursera_scraper import scrape_coursera_profile, validate_coursera_url
-    from bonus_calculatorF.bonus_calculator import calculate_from_scraper_result
-    COURSERA_AVAILABLE = True
-except ImportError:
-    COURSERA_AVAILABLE = False
+# Coursera scraping needs requests and BeautifulSoup; the scraper and the
+# bonus calculator themselves are imported when the feature is first used.
+COURSERA_AVAILABLE = all(find_spec(name) is not None for name in ("requests", "bs4"))
 
 class SimpleUnifiedRankingApp:
     """Simple version of the main application with fixed password input"""
@@ -276,6 +273,9 @@ class SimpleUnifiedRankingApp:
             print("Extract course data from your public Coursera profile")
             print("Example URL: https://www.coursera.org/user/your-username")
             
+            from cousera.coursera_scraper import scrape_coursera_profile, validate_coursera_url
+            from bonus_calculatorF.bonus_calculator import calculate_from_scraper_result
+            
             # Get Coursera profile URL
             profile_url = input("\nEnter your Coursera profile URL: ").strip()
             
@@ -3,56 +3,116 @@ import re
 import json
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
-
-def fetch_codechef_profile(username):
-    url = f"https://www.codechef.com/users/{username}"
+from utils.http_cache import cached_get
+from rating_scraper_api.codechef_parser import FULLY_SOLVED_PATTERN, extract_profile_fields
+
+CODECHEF_PROFILE_URL = "https://www.codechef.com/users/{username}"
+
+def load_codechef_profile(username):
+    """
+    Fetch and parse a CodeChef profile page once.
+
+    Returns every field the ranking and heatmap paths need: rating, stars,
+    global rank, fully-solved count, the SVG activity cells and the
+    per-day submission counts from the page's activityData script.
+    The page comes from the shared response cache, so the rating fetch and
+    the heatmap share one download.
+    """
+    url = CODECHEF_PROFILE_URL.format(username=username)
     headers = {
         'User-Agent': 'Mozilla/5.0'
     }
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = cached_get(url, headers=headers, timeout=10)
         if response.status_code != 200:
             return {'error': f"Failed to fetch profile. HTTP {response.status_code}"}
         
         html = response.text
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Rating
-        rating_tag = soup.find("div", class_="rating-number")
-        rating = rating_tag.text.strip() if rating_tag else "N/A"
-
-        # Stars
-        stars_tag = soup.find("span", class_="rating")
-        stars = stars_tag.text.strip() if stars_tag else "N/A"
-
-        # Global Rank
-        global_rank = "N/A"
-        global_rank_tag = soup.find('td', string=re.compile("Global Rank"))
-        if global_rank_tag and global_rank_tag.find_next_sibling("td"):
-            global_rank = global_rank_tag.find_next_sibling("td").text.strip()
-
-        # Fully Solved
-        fully_solved = "N/A"
-        match = re.search(r'Fully Solved\s*\((\d+)\)', html)
-        if match:
-            fully_solved = match.group(1)
-
-        activity_map = extract_activity_heatmap(html, soup)
-
-        return {
-            'username': username,
-            'rating': rating,
-            'stars': stars,
-            'global_rank': global_rank,
-            'fully_solved': fully_solved,
-            'activity_map': activity_map
-        }
+        return parse_codechef_profile(username, html)
     except requests.RequestException as e:
         return {'error': f"Connection error: {str(e)}"}
     except Exception as e:
         return {'error': f"Unexpected error: {str(e)}"}
 
+def parse_codechef_profile(username, html):
+    # Streaming extraction first; the full soup parse is only a fallback
+    try:
+        fields = extract_profile_fields(html)
+    except Exception:
+        return parse_codechef_profile_soup(username, html)
+
+    cells = fields['cells']
+    script = fields['activity_script']
+    return {
+        'username': username,
+        'rating': fields['rating'] if fields['rating'] is not None else "N/A",
+        'stars': fields['stars'] if fields['stars'] is not None else "N/A",
+        'global_rank': fields['global_rank'] if fields['global_rank'] is not None else "N/A",
+        'fully_solved': fields['fully_solved'] or "N/A",
+        'activity_map': {'cells': cells} if cells else {'error': 'No activity data found'},
+        'activity_counts': parse_activity_data(script) if script else None
+    }
+
+def parse_codechef_profile_soup(username, html):
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Rating
+    rating_tag = soup.find("div", class_="rating-number")
+    rating = rating_tag.text.strip() if rating_tag else "N/A"
+
+    # Stars
+    stars_tag = soup.find("span", class_="rating")
+    stars = stars_tag.text.strip() if stars_tag else "N/A"
+
+    # Global Rank
+    global_rank = "N/A"
+    global_rank_tag = soup.find('td', string=re.compile("Global Rank"))
+    if global_rank_tag and global_rank_tag.find_next_sibling("td"):
+        global_rank = global_rank_tag.find_next_sibling("td").text.strip()
+
+    # Fully Solved
+    fully_solved = "N/A"
+    match = FULLY_SOLVED_PATTERN.search(html)
+    if match:
+        fully_solved = match.group(1)
+
+    return {
+        'username': username,
+        'rating': rating,
+        'stars': stars,
+        'global_rank': global_rank,
+        'fully_solved': fully_solved,
+        'activity_map': extract_activity_heatmap(html, soup),
+        'activity_counts': extract_activity_counts(soup)
+    }
+
+def fetch_codechef_profile(username):
+    profile = load_codechef_profile(username)
+    if 'error' in profile:
+        return profile
+    return {key: profile[key] for key in
+            ('username', 'rating', 'stars', 'global_rank', 'fully_solved', 'activity_map')}
+
+def extract_activity_counts(soup):
+    """Per-day submission counts from the activityData script (None if absent)."""
+    script = soup.find("script", string=lambda s: s and "activityData" in s)
+    if not script:
+        return None
+    return parse_activity_data(script.string)
+
+def parse_activity_data(script_text):
+    match = re.search(r'activityData\s*=\s*(\{.*?\});', script_text, re.DOTALL)
+    if not match:
+        return None
+
+    data = json.loads(match.group(1))
+    counts = {}
+    for entry in data.get('data', []):
+        date = entry['date']
+        counts[date] = counts.get(date, 0) + entry['value']
+    return counts
+
 def extract_activity_heatmap(html, soup=None):
     if soup is None:
         soup = BeautifulSoup(html, 'html.parser')
@@ -1,15 +1,25 @@
 # api.py
 
+import re
+import time
+from urllib.parse import quote_plus
 import requests
+from utils.http_cache import cached_get
+
+CODEFORCES_API_URL = "https://codeforces.com/api"
+# user.info accepts up to 10000 semicolon-separated handles per call; the
+# practical limit is the request line length the server will accept.
+MAX_HANDLES_PER_CALL = 10000
+MAX_URL_LENGTH = 8000
 
 def fetch_codeforces_profile_api(handle):
-    url = f"https://codeforces.com/api/user.info?handles={handle}"
+    url = f"{CODEFORCES_API_URL}/user.info"
     headers = {
         'User-Agent': 'Mozilla/5.0'
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = cached_get(url, params={'handles': handle}, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -18,12 +28,7 @@ def fetch_codeforces_profile_api(handle):
             return {'error': data.get('comment', 'Unknown error'), 'rating': 'N/A', 'handle': handle}
         
         user = data['result'][0]
-        return {
-            'rating': str(user.get('rating', 'N/A')),
-            'handle': handle,
-            'rank': user.get('rank', 'N/A'),
-            'maxRating': str(user.get('maxRating', 'N/A'))
-        }
+        return _profile_from_user(user, handle)
     except requests.RequestException as e:
         print(f"Error fetching profile via API: {e}")
         return {'error': str(e), 'rating': 'N/A', 'handle': handle}
@@ -32,6 +37,105 @@ def fetch_codeforces_profile_api(handle):
         return {'error': str(e), 'rating': 'N/A', 'handle': handle}
 
 
+def _profile_from_user(user, handle):
+    return {
+        'rating': str(user.get('rating', 'N/A')),
+        'handle': handle,
+        'rank': user.get('rank', 'N/A'),
+        'maxRating': str(user.get('maxRating', 'N/A'))
+    }
+
+
+def _chunk_handles(handles, max_handles, max_url_length):
+    """Split handles into the largest batches allowed by both limits.
+
+    Lengths are those of the URL-encoded query, as sent.
+    """
+    base_length = len(f"{CODEFORCES_API_URL}/user.info?handles=")
+    separator = len(quote_plus(';'))
+    batch, length = [], base_length
+    for handle in handles:
+        encoded = len(quote_plus(handle))
+        extra = encoded + (separator if batch else 0)
+        if batch and (len(batch) >= max_handles or length + extra > max_url_length):
+            yield batch
+            batch, length = [], base_length
+            extra = encoded
+        batch.append(handle)
+        length += extra
+    if batch:
+        yield batch
+
+
+def fetch_codeforces_profiles_bulk(handles, max_handles=MAX_HANDLES_PER_CALL,
+                                   max_url_length=MAX_URL_LENGTH, request_interval=2.0):
+    """
+    Fetch many Codeforces profiles with batched user.info calls.
+
+    Returns {handle: profile} with the same profile/error dicts as
+    fetch_codeforces_profile_api. A batch rejected because of one handle
+    (e.g. "User with handle X not found") is retried without that handle;
+    an error that names no handle splits the batch in half until the
+    offending handles are isolated. request_interval seconds are left
+    between calls (Codeforces asks for at most one call every 2 seconds).
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0'
+    }
+    results = {}
+    last_call = None
+
+    def call(batch):
+        nonlocal last_call
+        if last_call is not None:
+            time.sleep(max(0.0, request_interval - (time.monotonic() - last_call)))
+        last_call = time.monotonic()
+        response = requests.get(f"{CODEFORCES_API_URL}/user.info", params={'handles': ';'.join(batch)},
+                                headers=headers, timeout=30)
+        # Codeforces answers bad handles with HTTP 400 and a JSON comment
+        try:
+            return response.json()
+        except ValueError:
+            response.raise_for_status()
+            raise
+
+    unique_handles = list(dict.fromkeys(h.strip() for h in handles if h and h.strip()))
+    pending = list(_chunk_handles(unique_handles, max_handles, max_url_length))[::-1]
+    while pending:
+        batch = pending.pop()
+        try:
+            data = call(batch)
+        except (requests.RequestException, ValueError) as e:
+            for handle in batch:
+                results[handle] = {'error': str(e), 'rating': 'N/A', 'handle': handle}
+            continue
+
+        if data.get('status') == 'OK':
+            users = {user['handle'].lower(): user for user in data['result']}
+            for handle in batch:
+                user = users.get(handle.lower())
+                if user is None:
+                    results[handle] = {'error': 'Missing from API response', 'rating': 'N/A', 'handle': handle}
+                else:
+                    results[handle] = _profile_from_user(user, handle)
+            continue
+
+        comment = data.get('comment', 'Unknown error')
+        match = re.search(r'handle (\S+) not found', comment)
+        bad = next((h for h in batch if match and h.lower() == match.group(1).lower()), None)
+        if bad is not None:
+            results[bad] = {'error': comment, 'rating': 'N/A', 'handle': bad}
+            rest = [h for h in batch if h != bad]
+            if rest:
+                pending.append(rest)
+        elif len(batch) > 1:
+            middle = len(batch) // 2
+            pending.extend([batch[middle:], batch[:middle]])
+        else:
+            results[batch[0]] = {'error': comment, 'rating': 'N/A', 'handle': batch[0]}
+    return results
+
+
 def print_profile(profile):
     """Print the Codeforces rating"""
     if not profile:
@@ -0,0 +1,147 @@
+"""
+Streaming extractor for CodeChef profile pages
+
+A BeautifulSoup tree of a full profile page costs far more than the handful
+of fields the scrapers read. CodeChefProfileParser is an ``HTMLParser`` that
+only keeps text for the elements it is looking for (div.rating-number,
+span.rating, the Global Rank cell, svg rect[data-date] and the activityData
+script) and extract_profile_fields stops feeding the page once all of them
+have been seen.
+"""
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict
+
+FULLY_SOLVED_PATTERN = re.compile(r'Fully Solved\s*\((\d+)\)')
+CHUNK_SIZE = 64 * 1024
+
+
+class CodeChefProfileParser(HTMLParser):
+    """Collects the CodeChef profile fields while the page is fed to it"""
+
+    def __init__(self):
+        super().__init__()
+        self.rating = None
+        self.stars = None
+        self.global_rank = None
+        self.cells = {}
+        self.activity_script = None
+        self.svg_done = False
+        # Element whose text is being captured: [field, tag, depth, parts]
+        self._capture = None
+        # Table cells are tracked separately so fields nested in them are still seen
+        self._td = None
+        self._rank_next = False
+        self._svg_depth = 0
+        self._in_script = False
+        self._script_parts = []
+
+    @property
+    def done(self) -> bool:
+        return (self.rating is not None and self.stars is not None
+                and self.global_rank is not None and self.svg_done
+                and self.activity_script is not None)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'td' and self.global_rank is None:
+            if self._td is None:
+                self._td = ['rank_value' if self._rank_next else 'rank_label', tag, 1, []]
+                self._rank_next = False
+            else:
+                self._td[2] += 1
+
+        if self._capture is not None:
+            if tag == self._capture[1]:
+                self._capture[2] += 1
+            return
+
+        if tag == 'script':
+            self._in_script = True
+            self._script_parts = []
+        elif tag == 'svg':
+            self._svg_depth += 1
+        elif tag == 'rect' and self._svg_depth:
+            attrs = dict(attrs)
+            date = attrs.get('data-date')
+            if date:
+                self.cells[date] = {'count': int(attrs.get('data-count') or 0),
+                                    'level': int(attrs.get('data-level') or 0)}
+        elif tag == 'div' and self.rating is None and self._has_class(attrs, 'rating-number'):
+            self._capture = ['rating', tag, 1, []]
+        elif tag == 'span' and self.stars is None and self._has_class(attrs, 'rating'):
+            self._capture = ['stars', tag, 1, []]
+
+    def handle_endtag(self, tag):
+        if tag == 'td' and self._td is not None:
+            self._td[2] -= 1
+            if not self._td[2]:
+                field, _, _, parts = self._td
+                self._td = None
+                text = ''.join(parts).strip()
+                if field == 'rank_label':
+                    self._rank_next = 'Global Rank' in text
+                else:
+                    self.global_rank = text
+
+        if self._capture is not None:
+            if tag != self._capture[1]:
+                return
+            self._capture[2] -= 1
+            if not self._capture[2]:
+                field, _, _, parts = self._capture
+                self._capture = None
+                setattr(self, field, ''.join(parts).strip())
+            return
+
+        if tag == 'script' and self._in_script:
+            self._in_script = False
+            if self.activity_script is None:
+                text = ''.join(self._script_parts)
+                if 'activityData' in text:
+                    self.activity_script = text
+        elif tag == 'svg' and self._svg_depth:
+            self._svg_depth -= 1
+            if not self._svg_depth and self.cells:
+                self.svg_done = True
+
+    def handle_data(self, data):
+        if self._td is not None:
+            self._td[3].append(data)
+        if self._capture is not None:
+            self._capture[3].append(data)
+        elif self._in_script:
+            self._script_parts.append(data)
+
+    @staticmethod
+    def _has_class(attrs, name):
+        for key, value in attrs:
+            if key == 'class' and value and name in value.split():
+                return True
+        return False
+
+
+def extract_profile_fields(html: str, chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Pull the profile fields out of ``html`` without building a document tree.
+
+    Returns rating, stars and global_rank (None when absent), fully_solved,
+    the SVG activity cells as {date: {'count', 'level'}} and the raw
+    activityData script text (None when absent).
+    """
+    parser = CodeChefProfileParser()
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+        if parser.done:
+            break
+    else:
+        parser.close()
+
+    match = FULLY_SOLVED_PATTERN.search(html)
+    return {
+        'rating': parser.rating,
+        'stars': parser.stars,
+        'global_rank': parser.global_rank,
+        'fully_solved': match.group(1) if match else None,
+        'cells': parser.cells,
+        'activity_script': parser.activity_script,
+    }
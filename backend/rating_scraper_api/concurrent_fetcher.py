@@ -0,0 +1,88 @@
+"""
+Concurrent profile fetching for the rating scrapers
+
+The platform fetchers each make one blocking HTTP call. ConcurrentFetcher runs
+many of them on a bounded thread pool, keeps at most ``per_host_limit``
+requests in flight per host, and yields results as they complete.
+"""
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+from rating_scraper_api.CodeChef_api import fetch_codechef_profile
+from rating_scraper_api.CodeForces_api import fetch_codeforces_profile_api
+from rating_scraper_api.leetcode_api import fetch_leetcode_profile
+
+# platform name -> (host used for concurrency limits, profile fetcher)
+PLATFORM_FETCHERS: Dict[str, Tuple[str, Callable[[str], Dict[str, Any]]]] = {
+    "Codeforces": ("codeforces.com", fetch_codeforces_profile_api),
+    "Leetcode": ("leetcode.com", fetch_leetcode_profile),
+    "CodeChef": ("www.codechef.com", fetch_codechef_profile),
+}
+
+# A job is (key, host, func, args); its result is yielded as (key, result).
+Job = Tuple[Hashable, str, Callable[..., Any], tuple]
+
+
+class ConcurrentFetcher:
+    """Bounded worker pool with per-host concurrency limits"""
+
+    def __init__(self, max_workers: int = 16, per_host_limit: int = 4):
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+
+    def run(self, jobs: Iterable[Job]) -> Iterator[Tuple[Hashable, Any]]:
+        """Run jobs concurrently, yielding (key, result) in completion order.
+
+        An exception raised by a job is yielded as {'error': str(exc)}, the
+        shape the platform fetchers already use for failures.
+        """
+        for key, ok, result in self.outcomes(jobs):
+            yield key, result if ok else {'error': result}
+
+    def outcomes(self, jobs: Iterable[Job]) -> Iterator[Tuple[Hashable, bool, Any]]:
+        """Run jobs concurrently, yielding (key, ok, result) in completion order.
+
+        ``ok`` is False when the job raised; ``result`` is then the error message.
+        """
+        queues = defaultdict(deque)
+        for key, host, func, args in jobs:
+            queues[host].append((key, func, args))
+        in_flight = defaultdict(int)
+        futures = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            def submit_ready():
+                for host, queue in queues.items():
+                    while queue and in_flight[host] < self.per_host_limit:
+                        key, func, args = queue.popleft()
+                        futures[pool.submit(func, *args)] = (key, host)
+                        in_flight[host] += 1
+
+            submit_ready()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key, host = futures.pop(future)
+                    in_flight[host] -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        yield key, False, str(e)
+                    else:
+                        yield key, True, result
+                submit_ready()
+
+    def fetch_profiles(self, pairs: Iterable[Tuple[str, str]],
+                       fetchers: Optional[Dict[str, Tuple[str, Callable]]] = None
+                       ) -> Iterator[Tuple[Tuple[str, str], Dict[str, Any]]]:
+        """Fetch (platform_name, handle) profiles, yielding ((platform, handle), profile)."""
+        fetchers = fetchers or PLATFORM_FETCHERS
+        jobs = []
+        for platform_name, handle in pairs:
+            if platform_name not in fetchers:
+                yield (platform_name, handle), {'error': f"No fetcher for platform {platform_name}"}
+                continue
+            host, func = fetchers[platform_name]
+            jobs.append(((platform_name, handle), host, func, (handle,)))
+        yield from self.run(jobs)
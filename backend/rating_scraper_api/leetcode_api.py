@@ -1,5 +1,6 @@
 import requests
 import json
+from utils.http_cache import cached_post
 
 def fetch_leetcode_profile(username):
     """
@@ -51,7 +52,7 @@ def fetch_leetcode_profile(username):
     variables = {'username': username}
 
     try:
-        response = requests.post(
+        response = cached_post(
             api_url,
             headers=headers,
             json={'query': query, 'variables': variables},
@@ -1,25 +1,50 @@
 """
 Enhanced Ranking System with Database Integration
 """
+import importlib
+import os
 from logic_formulas.formula_main import UnifiedRankingSystem, User
-from rating_scraper_api.CodeForces_api import fetch_codeforces_profile_api
-from rating_scraper_api.leetcode_api import fetch_leetcode_profile
-from rating_scraper_api.CodeChef_api import fetch_codechef_profile
-from bonus_calculatorF import bonus_calculator
 from services.auth_service import AuthenticationService
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Callable, Dict, List, Tuple, Optional, Union
+
+
+def _lazy_fetcher(module_name: str, func_name: str) -> Callable:
+    """Profile fetcher that imports its scraper module on first call
+
+    The scrapers pull in requests and BeautifulSoup; keeping them off the
+    import path lets the CLI start without paying for platforms it never queries.
+    """
+    def fetch(*args, **kwargs):
+        return getattr(importlib.import_module(module_name), func_name)(*args, **kwargs)
+    fetch.__name__ = func_name
+    return fetch
+
 
 class EnhancedRankingSystem:
     """Enhanced ranking system with user management and database integration"""
     
-    def __init__(self, auth_service):
-        """Initialize the enhanced ranking system (compatible with both auth services)"""
+    def __init__(self, auth_service, snapshot_path: Optional[str] = None):
+        """Initialize the enhanced ranking system (compatible with both auth services)
+
+        If snapshot_path points to a saved ranking snapshot, ranking state is
+        restored from it instead of being rebuilt; it is re-saved after every
+        calculate_user_ranking call.
+        """
         self.auth_service = auth_service
-        self.ranking_system = UnifiedRankingSystem()
+        self.snapshot_path = snapshot_path
+        if snapshot_path and os.path.exists(snapshot_path):
+            self.ranking_system = UnifiedRankingSystem.load_snapshot(snapshot_path)
+        else:
+            # Incremental mode: per-platform updates don't recompute every user;
+            # a weight change is applied once, when scores are next read.
+            self.ranking_system = UnifiedRankingSystem(incremental=True)
         self.platform_configs = {
-            "Codeforces": {"max_rating": 3000, "api_func": fetch_codeforces_profile_api},
-            "Leetcode": {"max_rating": 2500, "api_func": fetch_leetcode_profile},
-            "CodeChef": {"max_rating": 1800, "api_func": fetch_codechef_profile},
+            "Codeforces": {"max_rating": 3000, "api_func": _lazy_fetcher(
+                "rating_scraper_api.CodeForces_api", "fetch_codeforces_profile_api")},
+            "Leetcode": {"max_rating": 2500, "api_func": _lazy_fetcher(
+                "rating_scraper_api.leetcode_api", "fetch_leetcode_profile")},
+            "CodeChef": {"max_rating": 1800, "api_func": _lazy_fetcher(
+                "rating_scraper_api.CodeChef_api", "fetch_codechef_profile")},
             "AtCoder": {"max_rating": 2800, "api_func": None},
             "HackerRank": {"max_rating": 2000, "api_func": None}
         }
@@ -28,7 +53,8 @@ class EnhancedRankingSystem:
     def _setup_platforms(self):
         """Setup all available platforms"""
         for platform_name, config in self.platform_configs.items():
-            self.ranking_system.add_platform(platform_name, config["max_rating"])
+            if platform_name not in self.ranking_system.platforms:
+                self.ranking_system.add_platform(platform_name, config["max_rating"])
     
     def fetch_platform_rating(self, platform_name: str, handle: str) -> Optional[int]:
         """Fetch rating from platform API"""
@@ -41,13 +67,60 @@ class EnhancedRankingSystem:
         
         try:
             profile_data = api_func(handle)
+        except Exception as e:
+            print(f"Error fetching {platform_name} rating: {e}")
+            return None
+        return self._rating_from_profile(platform_name, profile_data)
+    
+    def _rating_from_profile(self, platform_name: str, profile_data: Optional[Dict]) -> Optional[int]:
+        """Extract the integer rating from a fetcher result (None if unavailable)"""
+        try:
             if profile_data and profile_data.get("rating") != 'N/A':
                 return int(profile_data["rating"])
         except Exception as e:
             print(f"Error fetching {platform_name} rating: {e}")
-        
         return None
     
+    def fetch_platform_ratings(self, pairs: List[Tuple[str, str]], max_workers: int = 16,
+                               per_host_limit: int = 4) -> Dict[Tuple[str, str], Optional[int]]:
+        """Fetch ratings for many (platform_name, handle) pairs concurrently
+
+        Codeforces handles are looked up together through batched user.info
+        calls; every other platform is fetched one handle per request.
+        """
+        from rating_scraper_api.CodeForces_api import fetch_codeforces_profiles_bulk
+        from rating_scraper_api.concurrent_fetcher import ConcurrentFetcher, PLATFORM_FETCHERS
+        
+        fetchers = {
+            name: (host, self.platform_configs[name]["api_func"])
+            for name, (host, _) in PLATFORM_FETCHERS.items()
+            if self.platform_configs.get(name, {}).get("api_func")
+        }
+        codeforces_handles = [handle for name, handle in pairs if name == "Codeforces" and name in fetchers]
+        jobs = [
+            ((name, handle), fetchers[name][0], fetchers[name][1], (handle,))
+            for name, handle in pairs
+            if name in fetchers and name != "Codeforces"
+        ]
+        if codeforces_handles:
+            jobs.append((("Codeforces", None), "codeforces.com",
+                         fetch_codeforces_profiles_bulk, (codeforces_handles,)))
+        
+        fetcher = ConcurrentFetcher(max_workers=max_workers, per_host_limit=per_host_limit)
+        ratings = {pair: None for pair in pairs}
+        for (platform_name, handle), ok, result in fetcher.outcomes(jobs):
+            if not ok:
+                print(f"Error fetching {platform_name} rating: {result}")
+                continue
+            if handle is None:
+                # One bulk job answers every Codeforces handle
+                for cf_handle in codeforces_handles:
+                    ratings[(platform_name, cf_handle)] = self._rating_from_profile(
+                        platform_name, result.get(cf_handle.strip()))
+            else:
+                ratings[(platform_name, handle)] = self._rating_from_profile(platform_name, result)
+        return ratings
+    
     def add_user_platform_rating(self, platform_name: str, handle: str, rating: Optional[int] = None) -> bool:
         """Add platform rating for current user"""
         try:
@@ -135,20 +208,26 @@ class EnhancedRankingSystem:
             if user_id not in self.ranking_system.users:
                 self.ranking_system.add_user(user_id)
             
-            # Load each platform's data
-            for platform_data in platforms:
-                platform_name = platform_data['platform_name']
-                rating = platform_data['rating']
-                
-                if platform_name in self.platform_configs:
-                    self.ranking_system.update_platform_stats(
-                        platform_name,
-                        difficulty=2100,
-                        participation=0.8,
-                        current_ratings={user_id: rating}
-                    )
-            
-            print(f"✅ Loaded {len(platforms)} platform ratings from database")
+            # Only ratings that differ from the ranking state (e.g. a snapshot
+            # restored at startup) are applied, in one batch (single recompute);
+            # replaying unchanged ratings would add a history entry per call.
+            current = self.ranking_system.users[user_id].platform_ratings
+            rows = [
+                (platform_data['platform_name'], user_id, platform_data['rating'])
+                for platform_data in platforms
+                if platform_data['platform_name'] in self.platform_configs
+                and current.get(platform_data['platform_name']) != platform_data['rating']
+            ]
+            if not rows:
+                print("✅ Ranking state is up to date with the database")
+                return
+            
+            self.ranking_system.bulk_update(
+                rows,
+                platform_stats={platform_name: (2100, 0.8) for platform_name, _, _ in rows}
+            )
+            
+            print(f"✅ Loaded {len(rows)} changed platform ratings from database")
             
         except Exception as e:
             print(f"Error loading user data: {e}")
@@ -178,6 +257,9 @@ class EnhancedRankingSystem:
             ranking_user.course_bonus = course_bonus
             ranking_user.total_rating = ranking_user.unified_rating + course_bonus
             
+            if self.snapshot_path:
+                self.ranking_system.save_snapshot(self.snapshot_path)
+            
             return {
                 "user_id": user_id,
                 "username": user['username'],
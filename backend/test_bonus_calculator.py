@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Bonus Calculator Tests - Course scoring against the reference behaviour
+"""
+import contextlib
+import io
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.append(str(backend_dir))
+
+from benchmarks.bench_bonus_calculator import substring_field_score, synthetic_catalog
+from bonus_calculatorF import bonus_calculator
+from bonus_calculatorF.bonus_calculator import FIELD_MATCHER, FIELD_SCORES
+from bonus_calculatorF.field_matcher import FieldMatcher
+
+
+def test_field_matcher_matches_substring_scan():
+    titles = [course["title"].lower() for course in synthetic_catalog(2000, seed=3)]
+    titles += ["", "default settings", "machine learning for deep learning engineers", "xyz"]
+    for title in titles:
+        assert (FIELD_MATCHER.best_score(title) or FIELD_SCORES["default"]) == substring_field_score(title)
+
+
+def test_field_matcher_handles_overlapping_keys():
+    matcher = FieldMatcher({"he": 1, "she": 2, "hers": 5, "his": 3})
+    assert matcher.best_match("ushers") == ("hers", 5)
+    assert matcher.best_match("ahishe") == ("his", 3)
+    assert matcher.best_match("nothing") == (None, 0)
+
+
+def test_batch_scoring_is_quiet_and_matches_course_bonus(capsys):
+    catalog = synthetic_catalog(300, seed=5)
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = [bonus_calculator.calculate_course_bonus(course) for course in catalog]
+
+    scores = bonus_calculator.score_courses(catalog, chunk_size=64)
+    profiles = bonus_calculator.score_profiles([{"completed_courses": catalog[:10]}, {}])
+    assert capsys.readouterr().out == ""
+
+    for course, score in zip(expected, scores):
+        assert score == {key: course[key] for key in ("bonus_points", "bonus_percentage", "bonus_breakdown",
+                                                   "score_table_version")}
+    assert profiles[0]["course_count"] == 10
+    assert profiles[0]["total_bonus_points"] == round(sum(s["bonus_points"] for s in scores[:10]), 1)
+    assert profiles[1] == {"total_bonus_points": 0, "course_count": 0, "courses": [],
+                           "score_table_version": bonus_calculator.SCORE_TABLES.version}
+
+
+def test_rescore_stored_courses(tmp_path):
+    from enhanced_db_model import EnhancedUserModel
+
+    db_path = str(tmp_path / "users.db")
+    EnhancedUserModel(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT OR IGNORE INTO institutions (name) VALUES ('Stanford University')")
+    institution_id = conn.execute("SELECT id FROM institutions WHERE name = 'Stanford University'").fetchone()[0]
+    conn.executemany(
+        "INSERT INTO user_courses_new (user_id, course_name, course_url, institution_id, duration_weeks, "
+        "skills_learned, institution_bonus, duration_bonus) VALUES (1, ?, ?, ?, ?, ?, 99, 4.5)",
+        [("Machine Learning", "u1", institution_id, 6, json.dumps(["Python", "TensorFlow"])),
+         ("Pottery", "u2", None, None, None),
+         ("Workshop", "u3", None, 0, None)])
+    conn.commit()
+    conn.close()
+
+    assert bonus_calculator.rescore_stored_courses(db_path, batch_size=1) == 3
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT institution_bonus, duration_bonus, field_bonus, skills_bonus, total_bonus "
+                        "FROM user_courses_new ORDER BY id").fetchall()
+    conn.close()
+    first = bonus_calculator.score_course({"title": "Machine Learning", "institution": "Stanford University",
+                                           "duration": "6 weeks", "skills": ["Python", "TensorFlow"]})
+    breakdown = first["bonus_breakdown"]
+    assert rows[0][:4] == (breakdown["institution"], breakdown["duration"], breakdown["field"], breakdown["skills"])
+    assert rows[0][4] == pytest.approx(first["bonus_points"], abs=0.05)
+    assert rows[1][0] == bonus_calculator.INSTITUTION_SCORES["default"]
+    # No stored duration_weeks: the stored duration bonus is kept
+    assert rows[1][1] == 4.5
+    # A stored 0 is a known (zero-week) duration, not a missing one
+    zero_weeks = bonus_calculator.score_course({"title": "Workshop", "duration": "0 weeks"})
+    assert rows[2][1] == zero_weeks["bonus_breakdown"]["duration"]
+    assert rows[2][1] != bonus_calculator.score_course({"title": "Workshop"})["bonus_breakdown"]["duration"]
+
+
+def test_name_normalization_resolves_variants():
+    institutions = bonus_calculator.INSTITUTION_NORMALIZER
+    skills = bonus_calculator.SKILL_NORMALIZER
+    assert institutions.canonical("Stanford") == "Stanford University"
+    assert institutions.canonical("  the university of OXFORD ") == "University of Oxford"
+    assert institutions.canonical("MIT") == "Massachusetts Institute of Technology"
+    assert institutions.canonical("Unlisted College") is None
+    assert institutions.score("Unlisted College") == bonus_calculator.INSTITUTION_SCORES["default"]
+    assert skills.canonical("Machine-Learning") == "machine learning"
+    assert skills.canonical("C++") == "c++" and skills.canonical("C#") == "c#"
+    assert skills.canonical("Node.JS") == "node.js"
+    assert skills.canonical("K8S") == "kubernetes"
+    assert skills.canonical("Default") is None
+
+    score = bonus_calculator.score_course({"title": "Intro", "institution": "Stanford",
+                                           "skills": ["Machine-Learning"]})
+    assert score["bonus_breakdown"]["institution"] == bonus_calculator.INSTITUTION_SCORES["Stanford University"]
+    assert score["bonus_breakdown"]["skills"] == bonus_calculator.SKILL_SCORES["machine learning"] * 2
+
+
+def test_short_institution_names_resolve_only_through_aliases():
+    from bonus_calculatorF.normalization import INSTITUTION_LEADING_WORDS, NameNormalizer
+
+    normalizer = NameNormalizer({"University of Springfield": 7, "Shelby University": 5, "default": 1},
+                                aliases={"Shelby": "Shelby University"},
+                                leading_words=INSTITUTION_LEADING_WORDS, cache_size=2)
+    assert normalizer.canonical("Springfield") is None
+    assert normalizer.canonical("Shelby") == "Shelby University"
+    assert normalizer.canonical("The University of Springfield") == "University of Springfield"
+    for name in ("a", "b", "c"):
+        normalizer.canonical(name)
+    assert normalizer.cache_info().currsize == 2
+
+    institutions = bonus_calculator.INSTITUTION_NORMALIZER
+    assert institutions.canonical("California") is None
+    assert institutions.canonical("London") is None
+    assert institutions.canonical("UCL") is None
+    assert institutions.score("California") == bonus_calculator.INSTITUTION_SCORES["default"]
+
+
+def test_profile_metrics_update_incrementally(capsys):
+    catalog = synthetic_catalog(41, seed=11)
+    for course, field in zip(catalog, ["machine learning", "design", "general", "finance"] * 11):
+        course["matched_field"] = field
+
+    full = bonus_calculator.calculate_profile_bonus({"name": "A", "completed_courses": catalog})
+    partial = bonus_calculator.calculate_profile_bonus({"name": "A", "completed_courses": catalog[:40]})
+    capsys.readouterr()
+    updated = bonus_calculator.add_course_to_profile(partial, catalog[40])
+    assert capsys.readouterr().out == ""
+
+    assert [c["bonus_points"] for c in updated["completed_courses"]] == \
+        [c["bonus_points"] for c in full["completed_courses"]]
+    metrics, expected = updated["profile_metrics"], full["profile_metrics"]
+    for key in ("total_bonus_points", "average_bonus_points", "max_bonus_points", "course_count", "career_focus"):
+        assert metrics[key] == expected[key]
+    assert [s["total_value"] for s in metrics["top_skills"]] == [s["total_value"] for s in expected["top_skills"]]
+    assert metrics["top_fields"][0] == {"name": "machine learning", "count": 11, "value": 10, "total_value": 110}
+    assert [f["name"] for f in metrics["top_fields"]] == ["machine learning", "finance", "design"]
+    assert metrics["career_focus"][0] == {"area": "AI & Machine Learning", "strength": 11}
+
+
+def test_columnar_scoring_matches_score_course():
+    from bonus_calculatorF.columnar import score_columns, score_course_columns
+
+    catalog = synthetic_catalog(2000, seed=13)
+    catalog += catalog[:500]
+    catalog += [{"title": "Machine Learning", "institution": None, "duration": 12, "skills": None},
+                {"title": "", "institution": " Stanford ", "duration": "3 months", "skills": ["ML", "ml"]}]
+    expected = bonus_calculator.score_courses(catalog)
+    scores = score_course_columns(catalog)
+
+    assert scores["bonus_points"].tolist() == [s["bonus_points"] for s in expected]
+    assert scores["bonus_percentage"].tolist() == [s["bonus_percentage"] for s in expected]
+    for key in ("institution", "duration", "field", "skills"):
+        assert scores["bonus_breakdown"][key].tolist() == [s["bonus_breakdown"][key] for s in expected]
+
+    assert score_columns([], [], [], [])["bonus_points"].tolist() == []
+    with pytest.raises(ValueError):
+        score_columns(["a"], [], [], [])
+
+
+def test_duration_parser_uses_the_course_length():
+    from bonus_calculatorF.duration_parser import DEFAULT_HOURS_PER_WEEK, duration_hours, duration_points
+
+    # Previously digit-joined into 310 months / 28 weeks / 16 weeks
+    assert duration_points("3 months at 10 hours a week") == 4
+    assert duration_points("2 months at 8 hours a week") == 3
+    assert duration_points("1 week at 6 hours") == 1
+    assert duration_hours("Approx. 4 weeks at 5 hours a week") == 20
+    assert duration_hours("10 hours a week for 6 weeks") == 60
+    assert duration_hours("6 weeks") == 6 * DEFAULT_HOURS_PER_WEEK
+
+    # Unchanged tiers and fallbacks
+    assert [duration_points(d) for d in ("12 weeks", "6 Weeks", "1 month", "Approx. 45 hours to complete",
+                                         "12 hours", "a few weeks", "Months", "some hours", "Self-paced", "")] == \
+        [5, 4, 2, 3, 1, 2, 3, 1, 2, 2]
+    assert [duration_points(d) for d in ("12-week course", "6-month program", "40-hour course", "2-3 weeks")] == \
+        [5, 5, 3, 2]
+    assert duration_hours("40-hour course") == 40
+    assert duration_points(None) == 0 and duration_hours(12) is None
+    assert duration_hours("3-4 hours/week") is None and duration_points("3-4 hours/week") == 1
+
+
+def test_score_tables_hot_reload(tmp_path):
+    from bonus_calculatorF import score_tables
+    from bonus_calculatorF.columnar import score_columns
+
+    original = bonus_calculator.SCORE_TABLES
+    course = {"title": "Intro to Machine Learning", "institution": "Stanford", "duration": "6 weeks",
+              "skills": ["Python"]}
+    before = bonus_calculator.score_course(course)
+    assert before["score_table_version"] == original.version
+
+    data = json.loads(score_tables.DEFAULT_TABLES_PATH.read_text(encoding="utf-8"))
+    data["institution_scores"]["Stanford University"] = 7
+    path = tmp_path / "score_tables.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    try:
+        version = bonus_calculator.reload_score_tables(str(path))
+        assert version != original.version
+        assert bonus_calculator.INSTITUTION_SCORES["Stanford University"] == 7
+        after = bonus_calculator.score_course(course)
+        assert after["score_table_version"] == version
+        assert after["bonus_breakdown"]["institution"] == 7
+        assert score_columns([course["title"]], [course["institution"]], [course["duration"]],
+                             [course["skills"]])["score_table_version"] == version
+
+        assert not score_tables.reload_if_changed(str(path))
+
+        # Only the active and the previous artifacts stay cached across reloads
+        for score in (6, 5):
+            data["institution_scores"]["Stanford University"] = score
+            path.write_text(json.dumps(data), encoding="utf-8")
+            bonus_calculator.reload_score_tables(str(path))
+        assert set(score_tables._compiled) == {bonus_calculator.SCORE_TABLES.version,
+                                               score_tables._previous.version}
+        assert version not in score_tables._compiled and original.version not in score_tables._compiled
+        version = bonus_calculator.SCORE_TABLES.version
+
+        path.write_text(json.dumps({"institution_scores": {}}), encoding="utf-8")
+        with pytest.raises(ValueError):
+            bonus_calculator.reload_score_tables(str(path))
+        assert bonus_calculator.SCORE_TABLES.version == version
+    finally:
+        bonus_calculator.reload_score_tables()
+
+    assert bonus_calculator.SCORE_TABLES.version == original.version
+    assert bonus_calculator.score_course(course) == before
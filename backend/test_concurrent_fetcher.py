@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Concurrent Fetcher Tests - Exercise the fetch pool against a local stub HTTP server
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.append(str(backend_dir))
+
+from rating_scraper_api.concurrent_fetcher import ConcurrentFetcher
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with StubHandler.lock:
+            StubHandler.active += 1
+            StubHandler.peak = max(StubHandler.peak, StubHandler.active)
+        time.sleep(0.1)
+        with StubHandler.lock:
+            StubHandler.active -= 1
+        handle = self.path.strip("/")
+        status = 404 if handle == "missing" else 200
+        body = json.dumps({"handle": handle, "rating": len(handle) * 100}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_fetches_concurrently_within_host_limit():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    def fetch(handle):
+        response = requests.get(f"{base_url}/{handle}", timeout=5)
+        response.raise_for_status()
+        return response.json()
+
+    handles = [f"user{i}" for i in range(12)] + ["missing"]
+    jobs = [(handle, "stub", fetch, (handle,)) for handle in handles]
+    try:
+        start = time.perf_counter()
+        results = dict(ConcurrentFetcher(max_workers=8, per_host_limit=4).run(jobs))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    assert set(results) == set(handles)
+    assert results["user3"] == {"handle": "user3", "rating": 500}
+    assert "error" in results["missing"]
+    assert StubHandler.peak <= 4
+    assert elapsed < 13 * 0.1 / 2
+
+
+def test_outcomes_report_failed_jobs_explicitly():
+    def fetch(value):
+        if value == "boom":
+            raise RuntimeError("boom")
+        return {"error": "a platform-level error is still a result"}
+
+    jobs = [(value, "stub", fetch, (value,)) for value in ("ok", "boom")]
+    outcomes = {key: (ok, result) for key, ok, result in ConcurrentFetcher().outcomes(jobs)}
+
+    assert outcomes["ok"] == (True, {"error": "a platform-level error is still a result"})
+    assert outcomes["boom"] == (False, "boom")
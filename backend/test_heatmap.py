@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Heatmap Tests - Activity decoding and aggregation
+"""
+import datetime
+import io
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.append(str(backend_dir))
+
+from enhanced_db_model import EnhancedUserModel
+from heatmap.activity import activity_window, to_activity_array, to_heatmap_dict
+from heatmap import codeforces_sync
+from heatmap.codeforces_sync import CodeforcesActivitySync, utc_daily_counts
+from heatmap import heat_map
+from heatmap.heat_map import (combine_heatmaps, decode_submission_calendar, decode_submission_calendars,
+                              draw_github_style_heatmap, render_stored_heatmaps, stored_heatmap,
+                              stored_streak_stats)
+from heatmap.render import render_heatmaps
+from heatmap.streaks import batch_streak_stats, streak_stats
+
+
+def test_submission_calendar_decodes_to_utc_days():
+    calendar = json.dumps({"1704067200": 3, "1704153600": 1, "1704239999": 2})
+    assert decode_submission_calendar(calendar) == {"2024-01-01": 3, "2024-01-02": 3}
+
+
+def test_submission_calendars_decode_in_one_batch():
+    calendars = [json.dumps({str(1704067200 + 86400 * i): i + 1 for i in range(n)}) for n in (0, 2, 5)]
+    heatmaps = decode_submission_calendars(calendars)
+    assert [len(h) for h in heatmaps] == [0, 2, 5]
+    assert heatmaps[2]["2024-01-05"] == 5
+
+
+def test_submission_calendar_is_never_evaluated():
+    with pytest.raises(ValueError):
+        decode_submission_calendar("__import__('os').getcwd()")
+    with pytest.raises(ValueError):
+        decode_submission_calendar("[1, 2]")
+
+
+class FakeStatusPages:
+    """user.status stand-in serving ``submissions`` newest first"""
+
+    def __init__(self, submissions):
+        self.submissions = submissions
+        self.requests = []
+
+    def __call__(self, handle, start, count):
+        self.requests.append((start, count))
+        newest_first = sorted(self.submissions, key=lambda s: -s['id'])
+        return newest_first[start - 1:start - 1 + count]
+
+
+def test_codeforces_sync_fetches_only_new_submissions(tmp_path):
+    day = 1704110400  # 2024-01-01 12:00 UTC
+    submissions = [{'id': i, 'creationTimeSeconds': day + 86400 * (i % 3)} for i in range(1, 251)]
+    db = EnhancedUserModel(str(tmp_path / "users.db"))
+    db.store_heatmap(7, "LeetCode", {"2024-01-01": 4})
+    sync = CodeforcesActivitySync(db, page_size=100, full_page_size=1000)
+    pages = FakeStatusPages(submissions)
+    sync._fetch_page = pages
+
+    assert sync.sync(7, "Tourist") == 250
+    assert pages.requests == [(1, 1000)]
+    assert sum(sync.daily_counts(7).values()) == 250
+
+    submissions += [{'id': i, 'creationTimeSeconds': day + 86400 * 5} for i in range(251, 256)]
+    pages.requests.clear()
+    assert sync.sync(7, "tourist") == 5
+    assert pages.requests == [(1, 100)]
+    assert sync.last_submission_id(7, "tourist") == 255
+    assert sum(sync.daily_counts(7).values()) == 255
+
+    pages.requests.clear()
+    assert sync.sync(7, "tourist") == 0
+    assert pages.requests == [(1, 100)]
+
+    # Codeforces days land in the shared activity table next to other platforms
+    calendar = db.get_activity_calendar(7, days=10, end_date="2024-01-06")
+    assert calendar["2024-01-01"] == 4 + 83 and calendar["2024-01-06"] == 5
+
+
+def test_codeforces_handle_change_replaces_activity(tmp_path):
+    day = 1704110400  # 2024-01-01 12:00 UTC
+    sync = CodeforcesActivitySync(EnhancedUserModel(str(tmp_path / "users.db")))
+    sync._fetch_page = FakeStatusPages([{'id': i, 'creationTimeSeconds': day} for i in range(1, 41)])
+    assert sync.sync(7, "old_handle") == 40
+
+    sync._fetch_page = FakeStatusPages([{'id': i, 'creationTimeSeconds': day} for i in range(500, 510)])
+    assert sync.sync(7, "new_handle") == 10
+    assert sync.daily_counts(7) == {"2024-01-01": 10}
+    assert sync.last_submission_id(7, "old_handle") is None
+
+
+def test_codeforces_status_pages_bypass_response_cache(monkeypatch):
+    calls = []
+
+    class Response:
+        def json(self):
+            return {'status': 'OK', 'result': [{'id': len(calls), 'creationTimeSeconds': 0}]}
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(params)
+        return Response()
+
+    monkeypatch.setattr(codeforces_sync.requests, "get", fake_get)
+    assert codeforces_sync.fetch_status_page("a&b", 1, 100) == [{'id': 1, 'creationTimeSeconds': 0}]
+    assert codeforces_sync.fetch_status_page("a&b", 1, 100) == [{'id': 2, 'creationTimeSeconds': 0}]
+    assert calls == [{'handle': "a&b", 'from': 1, 'count': 100}] * 2
+
+
+def test_codeforces_days_are_utc():
+    # 23:30 UTC and 00:30 UTC the next day, whatever the local timezone
+    assert utc_daily_counts([1704151800, 1704155400]) == {"2024-01-01": 1, "2024-01-02": 1}
+
+
+def test_activity_store_upserts_and_combines_platforms(tmp_path):
+    db = EnhancedUserModel(str(tmp_path / "users.db"))
+    db.store_heatmap(1, "Codeforces", {"2024-03-01": 2, "2024-03-02": 1})
+    db.store_heatmap(1, "LeetCode", {"2024-03-01": 4, "2023-01-01": 9})
+    db.upsert_user_activity([(1, "codeforces", "2024-03-02", 5), (2, "codechef", "2024-02-29", 3)])
+
+    calendars = db.get_activity_calendars([1, 2, 3], days=365, end_date="2024-03-31")
+    assert calendars == {1: {"2024-03-01": 6, "2024-03-02": 5}, 2: {"2024-02-29": 3}, 3: {}}
+    assert db.get_activity_calendar(1, days=1, end_date="2024-03-02") == {"2024-03-02": 5}
+    with pytest.raises(ValueError):
+        db.upsert_user_activity([(1, "NoSuchJudge", "2024-03-01", 1)])
+
+
+def test_fetched_heatmaps_are_stored_and_read_back(tmp_path, monkeypatch):
+    today = datetime.date.today()
+    days = [str(today - datetime.timedelta(days=d)) for d in range(3)]
+    monkeypatch.setattr(heat_map, "load_codechef_profile",
+                        lambda handle: {"activity_counts": {days[0]: 2, days[1]: 1}})
+    db = EnhancedUserModel(str(tmp_path / "users.db"))
+    db.store_heatmap(1, "LeetCode", {days[1]: 3, days[2]: 1})
+
+    assert heat_map.get_codechef_heatmap("chef") == {days[0]: 2, days[1]: 1}
+    assert stored_heatmap(db, 1) == {days[1]: 3, days[2]: 1}  # nothing stored without a user
+    heat_map.get_codechef_heatmap("chef", db=db, user_id=1)
+    assert stored_heatmap(db, 1) == {days[0]: 2, days[1]: 4, days[2]: 1}
+
+    stats = stored_streak_stats(db, [1, 2])
+    assert stats[1] == {'max_streak': 3, 'current_streak': 3, 'active_days': 3, 'total': 7}
+    assert stats[2]['total'] == 0
+    paths = render_stored_heatmaps(db, [1], str(tmp_path / "out"), fmt="svg")
+    assert Path(paths["1"]).exists()
+
+
+def naive_streaks(counts):
+    streak = max_streak = 0
+    for count in counts:
+        streak = streak + 1 if count > 0 else 0
+        max_streak = max(max_streak, streak)
+    current = 0
+    for count in reversed(counts):
+        if count <= 0:
+            break
+        current += 1
+    return max_streak, current
+
+
+def test_batch_streak_stats_match_day_by_day_scan():
+    rng = np.random.default_rng(7)
+    counts = rng.integers(0, 3, size=(200, 366)) * (rng.random((200, 366)) < 0.8)
+    counts[0] = 0
+    counts[1] = 1
+    stats = batch_streak_stats(counts)
+    for row, user_counts in enumerate(counts.tolist()):
+        assert (stats['max_streak'][row], stats['current_streak'][row]) == naive_streaks(user_counts)
+    assert stats['active_days'].tolist() == (counts > 0).sum(axis=1).tolist()
+    assert streak_stats([0, 2, 1, 0, 3, 4, 5]) == {
+        'max_streak': 3, 'current_streak': 3, 'active_days': 5, 'total': 15}
+
+
+def test_heatmaps_render_headless_to_buffers_and_files(tmp_path):
+    today = datetime.date.today()
+    heatmap = {str(today - datetime.timedelta(days=d)): d % 25 for d in range(0, 30)}
+
+    buffer = io.BytesIO()
+    stats = draw_github_style_heatmap(heatmap, output=buffer)
+    assert buffer.getvalue().startswith(b"\x89PNG")
+    assert stats['current_streak'] == 0 and stats['max_streak'] == 24
+
+    paths = render_heatmaps({"alice": heatmap, "bob": {}}, str(tmp_path), fmt="svg")
+    assert sorted(paths) == ["alice", "bob"]
+    assert Path(paths["alice"]).read_text().lstrip().startswith("<?xml")
+
+
+def test_activity_arrays_combine_by_addition_and_window_by_slicing():
+    codeforces = {"2024-02-28": 2, "2024-03-01": 1, "2007-12-31": 5}
+    leetcode = to_activity_array({"2024-03-01": 4, "2024-03-05": 3})
+    combined = combine_heatmaps(codeforces, leetcode)
+    assert to_heatmap_dict(combined) == {"2024-02-28": 2, "2024-03-01": 5, "2024-03-05": 3}
+
+    window, start = activity_window(combined, end_date=datetime.date(2024, 3, 2), days=4)
+    assert start == datetime.date(2024, 2, 28)
+    assert window.tolist() == [2, 0, 5, 0]  # 2024 is a leap year
+    assert activity_window({}, end_date=datetime.date(2024, 3, 2), days=3)[0].tolist() == [0, 0, 0]
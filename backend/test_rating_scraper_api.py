@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Rating Scraper API Tests - Run the fetchers against local stub HTTP servers
+"""
+import json
+import sys
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.append(str(backend_dir))
+
+from rating_scraper_api import CodeChef_api, CodeForces_api
+from heatmap import heat_map
+from utils.http_cache import ResponseCache, set_default_cache
+
+
+@contextmanager
+def stub_server(handler):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+
+
+class CodeforcesUserInfo(BaseHTTPRequestHandler):
+    calls = []
+    paths = []
+
+    def do_GET(self):
+        handles = parse_qs(urlparse(self.path).query)["handles"][0].split(";")
+        CodeforcesUserInfo.calls.append(handles)
+        CodeforcesUserInfo.paths.append(self.path)
+        missing = [h for h in handles if h.startswith("ghost")]
+        if missing:
+            status, data = 400, {"status": "FAILED",
+                                 "comment": f"handles: User with handle {missing[0]} not found"}
+        else:
+            status, data = 200, {"status": "OK", "result": [
+                {"handle": h.upper(), "rating": 1000 + len(h), "rank": "expert"} for h in handles]}
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_codeforces_bulk_batches_and_isolates_missing_handles(monkeypatch):
+    handles = [f"coder{i}" for i in range(250)] + ["ghost1", "ghost2"]
+    with stub_server(CodeforcesUserInfo) as base_url:
+        monkeypatch.setattr(CodeForces_api, "CODEFORCES_API_URL", base_url)
+        profiles = CodeForces_api.fetch_codeforces_profiles_bulk(
+            handles, max_handles=100, request_interval=0)
+
+    assert set(profiles) == set(handles)
+    assert profiles["coder7"] == {"rating": "1006", "handle": "coder7", "rank": "expert", "maxRating": "N/A"}
+    assert "not found" in profiles["ghost2"]["error"]
+    assert max(len(batch) for batch in CodeforcesUserInfo.calls) == 100
+    assert len(CodeforcesUserInfo.calls) <= 5
+
+
+def test_codeforces_bulk_encodes_handles_within_url_budget(monkeypatch):
+    handles = [f"c&d {i}" for i in range(60)]
+    CodeforcesUserInfo.calls, CodeforcesUserInfo.paths = [], []
+    with stub_server(CodeforcesUserInfo) as base_url:
+        monkeypatch.setattr(CodeForces_api, "CODEFORCES_API_URL", base_url)
+        profiles = CodeForces_api.fetch_codeforces_profiles_bulk(
+            handles, max_url_length=200, request_interval=0)
+
+        assert set(profiles) == set(handles)
+        assert sorted(h for batch in CodeforcesUserInfo.calls for h in batch) == sorted(handles)
+        assert len(CodeforcesUserInfo.calls) > 1
+        assert max(len(base_url + path) for path in CodeforcesUserInfo.paths) <= 200
+
+
+class EtagPage(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        revalidated = self.headers.get("If-None-Match") == '"v1"'
+        EtagPage.hits.append(304 if revalidated else 200)
+        if revalidated:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = b"<div class='rating-number'>1876</div>"
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_response_cache_serves_fresh_entries_and_revalidates(tmp_path):
+    with stub_server(EtagPage) as base_url:
+        url = f"{base_url}/users/chef"
+        cache = ResponseCache(cache_dir=str(tmp_path), ttls={url: 60})
+        first = cache.get(url, timeout=5)
+        second = cache.get(url, timeout=5)
+        assert EtagPage.hits == [200]
+        assert second.from_cache and second.text == first.text
+
+        restarted = ResponseCache(cache_dir=str(tmp_path), ttls={url: 0})
+        third = restarted.get(url, timeout=5)
+        assert EtagPage.hits == [200, 304]
+        assert third.from_cache and "1876" in third.text
+
+
+class WhoAmIPage(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        WhoAmIPage.hits += 1
+        body = (self.headers.get("Authorization") or self.headers.get("Cookie") or "anonymous").encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_response_cache_keeps_callers_with_credentials_apart(tmp_path):
+    import os
+    import requests
+
+    cache = ResponseCache(cache_dir=str(tmp_path / "http"), ttls={"http://127.0.0.1": 60})
+    assert os.stat(tmp_path / "http").st_mode & 0o777 == 0o700
+    with stub_server(WhoAmIPage) as base_url:
+        url = f"{base_url}/me"
+        assert cache.get(url, timeout=5).text == "anonymous"
+        assert cache.get(url, headers={"Authorization": "Bearer alice"}, timeout=5).text == "Bearer alice"
+        assert cache.get(url, headers={"authorization": "Bearer bob"}, timeout=5).text == "Bearer bob"
+        assert cache.get(url, cookies={"session": "carol"}, timeout=5).text == "session=carol"
+        session = requests.Session()
+        session.cookies.set("session", "dave")
+        assert cache.get(url, session=session, timeout=5).text == "session=dave"
+        assert WhoAmIPage.hits == 5
+
+        # Same caller, same credentials: served from the cache
+        assert cache.get(url, headers={"Authorization": "Bearer alice"}, timeout=5).from_cache
+        assert cache.get(url, timeout=5).text == "anonymous"
+        assert WhoAmIPage.hits == 5
+
+
+CODECHEF_PAGE = """<html><body>
+<div class="rating-number">1876</div><span class="rating">3&#9733;</span>
+<table><tr><td>Global Rank</td><td>4321</td></tr></table>
+<h3>Fully Solved (57)</h3>
+<svg><rect data-date="2024-01-02" data-count="3"></rect></svg>
+<script>var activityData = {"data": [{"date": "2024-01-02", "value": 2},
+  {"date": "2024-01-02", "value": 1}, {"date": "2024-01-05", "value": 4}]};</script>
+</body></html>"""
+
+
+class CodeChefProfilePage(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        CodeChefProfilePage.hits += 1
+        body = CODECHEF_PAGE.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_codechef_rating_and_heatmap_share_one_fetch(monkeypatch):
+    set_default_cache(ResponseCache(cache_dir=None, ttls={"http://127.0.0.1": 900}))
+    try:
+        with stub_server(CodeChefProfilePage) as base_url:
+            monkeypatch.setattr(CodeChef_api, "CODECHEF_PROFILE_URL", base_url + "/users/{username}")
+            profile = CodeChef_api.fetch_codechef_profile("chef")
+            heatmap = heat_map.get_codechef_heatmap("chef")
+    finally:
+        set_default_cache(None)
+
+    assert CodeChefProfilePage.hits == 1
+    assert profile["rating"] == "1876"
+    assert profile["global_rank"] == "4321"
+    assert profile["fully_solved"] == "57"
+    assert "activity_counts" not in profile
+    assert heatmap == {"2024-01-02": 3, "2024-01-05": 4}
+
+
+def test_codechef_streaming_extractor_matches_soup_parse():
+    pages = [
+        CODECHEF_PAGE,
+        CODECHEF_PAGE.replace("<svg>", "<table><tr><td><svg>").replace("</svg>", "</svg></td></tr></table>"),
+        "<html><body><div class='rating-number'><b>1500</b></div></body></html>",
+        "<html><body><p>No such user</p></body></html>",
+    ]
+    for html in pages:
+        assert CodeChef_api.parse_codechef_profile("chef", html) == \
+            CodeChef_api.parse_codechef_profile_soup("chef", html)
+
+
+def test_codechef_extractors_agree_on_saved_profile_page():
+    # Full page with the activityData script at the end (see bench_codechef_parse.py)
+    html = (backend_dir / "benchmarks" / "fixtures" / "codechef_profile.html").read_text(encoding="utf-8")
+    profile = CodeChef_api.parse_codechef_profile("chef_rahul", html)
+    assert profile == CodeChef_api.parse_codechef_profile_soup("chef_rahul", html)
+    assert (profile["rating"], profile["global_rank"], profile["fully_solved"]) == ("1876", "4321", "57")
+    assert len(profile["activity_map"]["cells"]) == 366
+    assert profile["activity_counts"] == {day: cell["count"] for day, cell in profile["activity_map"]["cells"].items()
+                                          if cell["count"]}
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Startup Import Tests - Entry points must not load feature-only dependencies
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.append(str(backend_dir))
+
+from benchmarks.check_import_time import BUDGETS
+
+
+def test_entry_points_defer_heavy_imports():
+    for module, (_, forbidden) in BUDGETS.items():
+        code = (f"import sys, {module}; "
+                f"print(' '.join(m for m in {forbidden!r} if m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=backend_dir,
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "", f"{module} loads {result.stdout.strip()} at startup"
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Unified Ranking Engine Tests - Verify the matrix engine against the reference loop
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.append(str(backend_dir))
+
+from logic_formulas.formula_main import UnifiedRankingSystem, User
+from benchmarks.bench_unified_ranking import build_system, legacy_update_all_ratings
+
+
+def test_matrix_matches_reference_loop():
+    system = build_system(500, missing=0.5, seed=7)
+    expected = legacy_update_all_ratings(system)
+    for user_id, user in system.users.items():
+        assert np.isclose(user.unified_rating, expected[user_id])
+        assert user.total_rating == user.unified_rating
+
+
+def test_user_without_ratings_uses_platform_history():
+    system = UnifiedRankingSystem()
+    system.add_platform("Codeforces", 3000)
+    system.add_user("idle")
+    system.update_platform_stats("Codeforces", 2100, 0.8, {"active": 1500})
+    assert system.users["idle"].unified_rating == 1500
+    assert system.users["active"].unified_rating == 1500
+
+
+def test_detached_user_keeps_plain_attributes():
+    user = User("temp")
+    user.total_rating = 12.5
+    assert user.total_rating == 12.5
+    assert user.unified_rating == 0.0
+
+
+def test_incremental_mode_matches_eager_recompute():
+    eager = UnifiedRankingSystem()
+    incremental = UnifiedRankingSystem(incremental=True, weight_tolerance=0.0)
+    rng = np.random.default_rng(3)
+    for system in (eager, incremental):
+        system.add_platform("Codeforces", 3000)
+        system.add_platform("Leetcode", 2500)
+    for i in range(200):
+        platform = "Codeforces" if i % 3 else "Leetcode"
+        rating = int(rng.integers(0, 2500))
+        for system in (eager, incremental):
+            system.update_platform_stats(platform, 2100, 0.8, {f"u{i % 50}": rating})
+
+    assert incremental.matrix.pending is not None
+    for user_id, user in eager.users.items():
+        assert np.isclose(incremental.users[user_id].unified_rating, user.unified_rating)
+    assert incremental.matrix.pending is None
+
+
+def test_incremental_update_rescores_only_changed_users():
+    system = build_system(5000, missing=0.3, seed=9)
+    system.incremental = True
+    system.add_user("idle")
+    system._update_all_ratings()
+    rng = np.random.default_rng(1)
+    computed = []
+    compute = system.matrix.compute
+    system.matrix.compute = lambda w, f, rows=None: computed.append(rows) or compute(w, f, rows=rows)
+
+    for platform, max_rating in (("Codeforces", 3000), ("Leetcode", 2500), ("CodeChef", 1800)):
+        users = rng.choice(5000, 200, replace=False)
+        ratings = {f"user{u}": int(r) for u, r in zip(users, rng.integers(0, max_rating, 200))}
+        system.update_platform_stats(platform, 2100, 0.8, ratings)
+        assert system.matrix.pending is None
+        unrated = [u for u, user in system.users.items() if not user.platform_ratings]
+        assert "idle" in unrated
+        assert computed[-1] is not None
+        assert len(computed[-1]) == len(set(ratings) | set(unrated)) < 1000
+        # Changed users are scored with the weights every other score was computed with
+        weights, system.final_weights = system.final_weights, system.matrix.weights
+        expected = legacy_update_all_ratings(system)
+        system.final_weights = weights
+        for user_id in list(ratings) + unrated:
+            assert np.isclose(system.users[user_id].unified_rating, expected[user_id])
+    assert all(rows is not None for rows in computed)
+
+    # Past the tolerance the full recompute is scheduled as before
+    system.weight_tolerance = 0.0
+    system.update_platform_stats("AtCoder", 2100, 0.8, {"user1": 100})
+    assert system.matrix.pending is not None
+
+
+def test_bulk_update_matches_per_platform_updates():
+    rows = [("Codeforces", "a", 1800), ("Codeforces", "b", 1200),
+            ("Leetcode", "a", 2000), ("Leetcode", "c", 1500)]
+    stats = {"Codeforces": (2100, 0.8), "Leetcode": (2100, 0.8)}
+
+    bulk = UnifiedRankingSystem()
+    looped = UnifiedRankingSystem()
+    for system in (bulk, looped):
+        system.add_platform("Codeforces", 3000)
+        system.add_platform("Leetcode", 2500)
+
+    bulk.bulk_update(rows, platform_stats=stats)
+    looped.update_platform_stats("Codeforces", 2100, 0.8, {"a": 1800, "b": 1200})
+    looped.update_platform_stats("Leetcode", 2100, 0.8, {"a": 2000, "c": 1500})
+
+    assert len(bulk.platforms["Codeforces"].historical_stats) == 1
+    assert bulk.final_weights == looped.final_weights
+    for user_id in ("a", "b", "c"):
+        assert np.isclose(bulk.users[user_id].unified_rating, looped.users[user_id].unified_rating)
+        assert bulk.users[user_id].platform_ratings == looped.users[user_id].platform_ratings
+
+
+def test_leaderboard_queries_match_full_sort():
+    system = build_system(2000, missing=0.4, seed=11)
+    for i, user in enumerate(list(system.users.values())[:300]):
+        user.total_rating = float(i % 7) * 300  # plenty of ties
+    expected = [u.user_id for u in sorted(system.users.values(), key=lambda u: -u.total_rating)]
+
+    assert [r[0] for r in system.get_rankings(50)] == expected[:50]
+    assert [r[0] for r in system.get_rankings_range(1000, 1050)] == expected[999:1050]
+    for user_id in (expected[0], expected[777], expected[-1]):
+        assert system.get_user_rank(user_id) == expected.index(user_id) + 1
+    assert [r[0] for r in system.get_rankings()] == expected
+    assert [r[0] for r in system.get_rankings_range(1000, 1050)] == expected[999:1050]
+
+
+def test_platform_history_is_bounded_with_window_means():
+    system = UnifiedRankingSystem()
+    system.add_platform("Codeforces", 3000, history_size=10, rating_log_size=25)
+    averages = []
+    for i in range(40):
+        ratings = {f"u{j}": 1000 + 10 * i + j for j in range(3)}
+        averages.append(np.mean(list(ratings.values())))
+        system.update_platform_stats("Codeforces", 2100, 0.8, ratings)
+
+    platform = system.platforms["Codeforces"]
+    assert len(platform.historical_stats) == 10
+    assert len(platform.rating_log) == 25
+    assert np.isclose(platform.history.window_mean(3), np.mean(averages[-3:]))
+    assert np.isclose(system._platform_fallback("Codeforces"), np.mean(averages[-3:]))
+    assert [r for _, r in platform.rating_log.history("u0")][-1] == 1390
+
+
+def test_snapshot_round_trip(tmp_path):
+    system = build_system(300, missing=0.3, seed=5)
+    system.users["user7"].course_bonus = 12.0
+    system.users["user7"].total_rating = system.users["user7"].unified_rating + 12.0
+    path = tmp_path / "ranking.snap"
+    system.save_snapshot(path)
+
+    restored = UnifiedRankingSystem.load_snapshot(path)
+    assert restored.get_rankings() == system.get_rankings()
+    assert restored.final_weights == system.final_weights
+    assert restored.users["user3"].platform_ratings == system.users["user3"].platform_ratings
+    assert len(restored.platforms["Leetcode"].historical_stats) == 1
+
+    restored.update_platform_stats("Leetcode", 2100, 0.8, {"newcomer": 2400})
+    assert np.isclose(restored.users["newcomer"].unified_rating, 2400)
+    assert UnifiedRankingSystem.load_snapshot(path).get_rankings() == system.get_rankings()
+
+
+def test_snapshot_weights_decay_to_load_time(tmp_path, monkeypatch):
+    from datetime import datetime, timedelta
+    from logic_formulas import formula_main
+
+    system = build_system(200, missing=0.3, seed=11)
+    # Half a day apart, so at the later load time the whole-day decay of
+    # Codeforces and of the other platforms differs by one more day
+    system.platforms["Codeforces"].last_update -= timedelta(days=20, hours=12)
+    system._calculate_weights()
+    system._update_all_ratings()
+    path = tmp_path / "ranking.snap"
+    system.save_snapshot(path)
+
+    later = datetime.now() + timedelta(days=30, hours=14)
+
+    class LaterDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return later
+
+    monkeypatch.setattr(formula_main, "datetime", LaterDatetime)
+    restored = UnifiedRankingSystem.load_snapshot(path)
+    for name, platform in restored.platforms.items():
+        days = (later - platform.last_update).days
+        assert np.isclose(restored.final_weights[name],
+                          restored.softmax_weights[name] * np.exp(-restored.decay_lambda * days))
+    ratio = restored.final_weights["Codeforces"] / restored.final_weights["Leetcode"]
+    saved_ratio = system.final_weights["Codeforces"] / system.final_weights["Leetcode"]
+    assert np.isclose(ratio, saved_ratio * np.exp(-restored.decay_lambda))
+
+    expected = legacy_update_all_ratings(restored)
+    rankings = restored.get_rankings()
+    assert rankings != system.get_rankings()
+    for user_id, unified, _, _ in rankings:
+        assert np.isclose(unified, expected[user_id])
+
+
+def test_snapshot_resave_releases_mapping(tmp_path):
+    import weakref
+
+    path = tmp_path / "ranking.snap"
+    build_system(50, missing=0.2, seed=3).save_snapshot(path)
+    restored = UnifiedRankingSystem.load_snapshot(path)
+    expected = restored.get_rankings()
+    mapping = restored.matrix.ratings
+    while not isinstance(mapping, np.memmap):
+        mapping = mapping.base
+    mapping = weakref.ref(mapping)
+
+    restored.save_snapshot(path)
+    assert mapping() is None
+    assert restored.get_rankings() == expected
+    assert UnifiedRankingSystem.load_snapshot(path).get_rankings() == expected
+
+
+class _StubAuth:
+    """Just enough of the auth service for EnhancedRankingSystem"""
+
+    def __init__(self, platforms):
+        self.platforms = platforms
+
+    def require_authentication(self):
+        pass
+
+    def get_current_user(self):
+        return {"id": 1, "username": "alice"}
+
+    def get_user_platforms(self):
+        return self.platforms
+
+    def get_user_courses(self):
+        return []
+
+
+def test_warm_start_only_applies_changed_ratings(tmp_path):
+    from services.ranking_service import EnhancedRankingSystem
+
+    path = str(tmp_path / "ranking.snap")
+    auth = _StubAuth([{"platform_name": "Codeforces", "rating": 1500},
+                      {"platform_name": "Leetcode", "rating": 1800}])
+    first = EnhancedRankingSystem(auth, snapshot_path=path).calculate_user_ranking()
+
+    warm = EnhancedRankingSystem(auth, snapshot_path=path)
+    history = {name: len(p.historical_stats) for name, p in warm.ranking_system.platforms.items()}
+    for _ in range(3):
+        assert warm.calculate_user_ranking()["platform_rating"] == first["platform_rating"]
+    assert {name: len(p.historical_stats) for name, p in warm.ranking_system.platforms.items()} == history
+
+    auth.platforms[0]["rating"] = 1700
+    warm.calculate_user_ranking()
+    assert len(warm.ranking_system.platforms["Codeforces"].historical_stats) == history["Codeforces"] + 1
+    assert len(warm.ranking_system.platforms["Leetcode"].historical_stats) == history["Leetcode"]
+    assert warm.ranking_system.users["1"].platform_ratings["Codeforces"] == 1700
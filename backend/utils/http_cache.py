@@ -0,0 +1,294 @@
+"""
+Shared HTTP response cache for the platform scrapers
+
+Responses are kept in an in-memory LRU and in a SQLite file on disk. Each
+endpoint has its own time-to-live (longest URL prefix in ``ttls`` wins);
+once an entry is stale it is revalidated with If-None-Match /
+If-Modified-Since when the server sent an ETag or Last-Modified header, so
+an unchanged page costs a 304 instead of a full download.
+
+Requests made with credentials (Authorization-style headers, cookies
+passed in or held by the session, ``auth``) are keyed by a hash of those
+credentials too, so an authenticated response is only ever served back to
+the same caller. The disk store lives in a per-user cache directory that
+only its owner can read.
+
+Only successful (HTTP 200) responses are stored. Network errors propagate
+as the usual ``requests`` exceptions.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Seconds a response stays fresh, by URL prefix
+DEFAULT_TTLS = {
+    "https://codeforces.com/api/user.info": 600,
+    "https://leetcode.com/graphql": 600,
+    "https://www.codechef.com/users/": 900,
+    "https://www.coursera.org/user/": 3600,
+}
+DEFAULT_TTL = 300
+DEFAULT_CACHE_DIR = os.environ.get(
+    "RANKING_HTTP_CACHE_DIR",
+    os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                 "unified_ranking", "http")
+)
+# Request headers that identify the caller; their values are part of the cache key
+CREDENTIAL_HEADERS = frozenset({"authorization", "proxy-authorization", "cookie",
+                                "x-csrftoken", "x-api-key"})
+
+
+class CachedResponse:
+    """The parts of ``requests.Response`` the scrapers use, rebuilt from a cache entry"""
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], content: bytes,
+                 encoding: Optional[str], from_cache: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.encoding = encoding
+        self.from_cache = from_cache
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self, **kwargs) -> Any:
+        return json.loads(self.content, **kwargs)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "CachedResponse":
+        return cls(response.url, response.status_code, dict(response.headers),
+                   response.content, response.encoding or response.apparent_encoding)
+
+
+class ResponseCache:
+    """In-memory LRU plus on-disk store with per-endpoint TTLs and revalidation"""
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, ttls: Optional[Dict[str, int]] = None,
+                 default_ttl: int = DEFAULT_TTL, max_entries: int = 512,
+                 max_memory_bytes: int = 64 * 1024 * 1024, max_disk_entries: int = 20000):
+        self.ttls = sorted((ttls or DEFAULT_TTLS).items(), key=lambda item: -len(item[0]))
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.db_path = None
+        if cache_dir:
+            # Cached pages can be user-specific: keep the store private to its owner
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            os.chmod(cache_dir, 0o700)
+            self.db_path = os.path.join(cache_dir, "responses.db")
+            self._init_db()
+
+    # ------------------ Storage ------------------
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_db(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                encoding TEXT,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        conn.commit()
+        conn.close()
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= len(old["content"])
+            self._memory[key] = entry
+            self._memory_bytes += len(entry["content"])
+            while self._memory and (len(self._memory) > self.max_entries
+                                    or self._memory_bytes > self.max_memory_bytes):
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted["content"])
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        if not self.db_path:
+            return None
+        conn = self._connect()
+        row = conn.execute('''
+            SELECT url, status_code, headers, content, encoding, stored_at
+            FROM responses WHERE key = ?
+        ''', (key,)).fetchone()
+        if row:
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        conn.close()
+        if not row:
+            return None
+        entry = {
+            "url": row[0], "status_code": row[1], "headers": json.loads(row[2]),
+            "content": row[3], "encoding": row[4], "stored_at": row[5],
+        }
+        self._remember(key, entry)
+        return entry
+
+    def _store(self, key: str, entry: Dict[str, Any]):
+        self._remember(key, entry)
+        if not self.db_path:
+            return
+        now = time.time()
+        conn = self._connect()
+        conn.execute('''
+            INSERT OR REPLACE INTO responses
+                (key, url, status_code, headers, content, encoding, stored_at, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (key, entry["url"], entry["status_code"], json.dumps(entry["headers"]),
+              entry["content"], entry["encoding"], entry["stored_at"], now))
+        conn.execute('''
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY last_access DESC LIMIT -1 OFFSET ?
+            )
+        ''', (self.max_disk_entries,))
+        conn.commit()
+        conn.close()
+
+    def clear(self):
+        """Drop every cached response (memory and disk)"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if self.db_path:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            conn.close()
+
+    # ------------------ Requests ------------------
+
+    def ttl_for(self, url: str) -> int:
+        for prefix, ttl in self.ttls:
+            if url.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def _credentials(session: Optional[requests.Session], headers: Any, cookies: Any, auth: Any) -> str:
+        """Canonical form of everything in a request that identifies the caller ('' for none)"""
+        merged = CaseInsensitiveDict(session.headers if session is not None else {})
+        merged.update(headers or {})
+        parts = sorted(f"header:{name.lower()}={value}" for name, value in merged.items()
+                       if name.lower() in CREDENTIAL_HEADERS)
+        if session is not None:
+            parts += sorted(f"cookie:{c.domain}{c.path}:{c.name}={c.value}" for c in session.cookies)
+        if cookies:
+            parts += sorted(f"cookie:{name}={value}" for name, value in cookies.items())
+        if auth is not None:
+            parts.append(f"auth:{auth!r}")
+        return "\n".join(parts)
+
+    @staticmethod
+    def _key(method: str, url: str, params: Any, json_body: Any, data: Any, credentials: str = "") -> str:
+        parts = [method.upper(), url, json.dumps(params, sort_keys=True, default=str),
+                 json.dumps(json_body, sort_keys=True, default=str), repr(data), credentials]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def request(self, method: str, url: str, session: Optional[requests.Session] = None,
+                ttl: Optional[int] = None, **kwargs) -> CachedResponse:
+        """Like ``requests.request``, answered from the cache while fresh"""
+        credentials = self._credentials(session, kwargs.get("headers"), kwargs.get("cookies"),
+                                        kwargs.get("auth"))
+        key = self._key(method, url, kwargs.get("params"), kwargs.get("json"), kwargs.get("data"),
+                        credentials)
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        entry = self._load(key)
+        now = time.time()
+        if entry is not None and now - entry["stored_at"] < ttl:
+            return CachedResponse(entry["url"], entry["status_code"], entry["headers"],
+                                  entry["content"], entry["encoding"], from_cache=True)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            cached_headers = CaseInsensitiveDict(entry["headers"])
+            if "ETag" in cached_headers:
+                headers["If-None-Match"] = cached_headers["ETag"]
+            if "Last-Modified" in cached_headers:
+                headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+        response = (session or requests).request(method, url, headers=headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            entry = dict(entry, stored_at=now)
+            self._store(key, entry)
+            return CachedResponse(entry["url"], entry["status_code"], entry["headers"],
+                                  entry["content"], entry["encoding"], from_cache=True)
+
+        result = CachedResponse.from_response(response)
+        if response.status_code == 200:
+            self._store(key, {
+                "url": result.url, "status_code": result.status_code, "headers": dict(result.headers),
+                "content": result.content, "encoding": result.encoding, "stored_at": now,
+            })
+        return result
+
+    def get(self, url: str, **kwargs) -> CachedResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> CachedResponse:
+        return self.request("POST", url, **kwargs)
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ResponseCache:
+    """Process-wide cache shared by all scrapers (created on first use)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
+
+
+def set_default_cache(cache: ResponseCache) -> None:
+    """Replace the shared cache (e.g. ResponseCache(cache_dir=None) for memory only)"""
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
+
+
+def cached_get(url: str, **kwargs) -> CachedResponse:
+    return get_default_cache().get(url, **kwargs)
+
+
+def cached_post(url: str, **kwargs) -> CachedResponse:
+    return get_default_cache().post(url, **kwargs)